@@ -0,0 +1,309 @@
+'''
+endpoint load test
+
+benchmark 전용 DB(기본값: 임시 SQLite 파일)에 데이터를 생성하고, main.app을 로컬 redis 대체(fakeredis)와 함께 실행한 후
+ASGI client로 읽기/쓰기 workload를 지정한 동시성으로 실행하여 endpoint별 p50/p95/p99 응답 시간, 처리량, 요청당 SQL 수를 측정
+
+    python -m benchmarks.load_test --workload mixed --requests 5000 --concurrency 32 --output results.json
+    python -m benchmarks.load_test --baseline benchmarks/baseline.json       # baseline보다 느려지면 exit code 1
+    python -m benchmarks.load_test --save-baseline benchmarks/baseline.json  # 현재 결과를 baseline으로 저장
+
+--url로 지정한 DB와 --real-redis로 사용하는 redis(.env의 REDIS_*)는 모든 데이터를 삭제한 후 사용하므로 운영 환경을 지정하지 않도록 주의
+'''
+import argparse
+import asyncio
+import contextvars
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field
+
+_sql_counter = contextvars.ContextVar("benchmark_sql_counter", default=None)
+
+WORKLOADS = {
+    "read": {
+        "board_list": 8, "board_list_cursor": 8, "board_detail": 10, "post_list": 12, "post_list_cursor": 12,
+        "post_detail": 30, "post_feed": 8, "post_search": 4, "post_batch": 4, "post_popular": 4,
+    },
+    "write": {
+        "post_create": 50, "post_update": 30, "board_create": 5, "login": 15,
+    },
+}
+WORKLOADS["mixed"] = {**{k: v * 9 for k, v in WORKLOADS["read"].items()}, **WORKLOADS["write"]}
+
+
+@dataclass
+class Context:
+    '''
+    workload 실행 정보
+
+        Attributes:
+            data (Dataset): 생성된 데이터 정보
+            tokens (dict[int, str]): {유저 순번: access token}
+            visible (dict[int, list[int]]): {유저 순번: 조회 가능한 게시판 ID 목록}
+            boards_created (int): benchmark 중 생성한 게시판 수
+    '''
+    data: object
+    tokens: dict = field(default_factory=dict)
+    visible: dict = field(default_factory=dict)
+    boards_created: int = 0
+
+
+def _hot(items: list, rng: random.Random):
+    '''
+    앞쪽 항목이 자주 선택되도록 pareto 분포로 항목 선택 (약 80%의 요청이 20%의 항목에 집중)
+    '''
+    return items[min(int(rng.paretovariate(1.16)) - 1, len(items) - 1)]
+
+
+def _request(name: str, ctx: Context, rng: random.Random):
+    '''
+    workload 항목 이름으로 (유저 순번, method, url, 추가 인자) 생성
+    '''
+    user = rng.choice(list(ctx.tokens))
+    data = ctx.data
+    board_id = _hot(ctx.visible[user], rng)
+    posts = data.board_posts[board_id] or data.board_posts[_hot(data.public_boards, rng)] or data.posts
+    if name == "board_list":
+        return user, "GET", f"/board/list/{min(int(rng.expovariate(1.0)), 5)}", {}
+    if name == "board_list_cursor":
+        return user, "GET", "/board/list", {}
+    if name == "board_detail":
+        return user, "GET", f"/board/get/{board_id}", {}
+    if name == "post_list":
+        return user, "GET", f"/post/list/{board_id}/{min(int(rng.expovariate(1.0)), 5)}", {}
+    if name == "post_list_cursor":
+        return user, "GET", f"/post/list/{board_id}", {}
+    if name == "post_detail":
+        return user, "GET", f"/post/get/{_hot(posts, rng)}", {}
+    if name == "post_feed":
+        return user, "GET", "/post/feed", {}
+    if name == "post_search":
+        return user, "GET", "/post/search", {"params": {"q": rng.choice(("redis", "cache index", "python feed"))}}
+    if name == "post_batch":
+        ids = ",".join(str(_hot(posts, rng)) for _ in range(20))
+        return user, "GET", "/post/batch", {"params": {"ids": ids}}
+    if name == "post_popular":
+        return user, "GET", f"/post/popular/{board_id}", {}
+    if name == "post_create":
+        return user, "POST", f"/post/create/{board_id}", {"json": {"title": "benchmark", "content": "benchmark " * 50}}
+    if name == "post_update":
+        if not data.user_posts.get(user):
+            return _request("post_create", ctx, rng)
+        post_id = rng.choice(data.user_posts[user])
+        return user, "PATCH", f"/post/update/{post_id}", {"json": {"title": "updated", "content": "updated " * 50}}
+    if name == "board_create":
+        ctx.boards_created += 1
+        return user, "POST", "/board/create", {"json": {"name": f"benchmark {ctx.boards_created}", "public": True}}
+    if name == "login":
+        return None, "POST", "/user/login", {"data": {"username": rng.choice(data.users), "password": "benchmark"}}
+    raise ValueError(name)
+
+
+def _percentile(samples: list, q: float):
+    ordered = sorted(samples)
+    return ordered[min(int(len(ordered) * q), len(ordered) - 1)]
+
+
+def summarize(records: list, elapsed: float):
+    '''
+    요청 기록을 endpoint별 응답 시간 백분위, 처리량, 요청당 SQL 수로 요약
+    '''
+    endpoints = {}
+    for name, latency, status_code, sql in records:
+        endpoint = endpoints.setdefault(name, {"latency": [], "errors": 0, "sql": 0})
+        endpoint["latency"].append(latency)
+        endpoint["sql"] += sql
+        if status_code >= 400:
+            endpoint["errors"] += 1
+    result = {}
+    for name, endpoint in sorted(endpoints.items()):
+        count = len(endpoint["latency"])
+        result[name] = {
+            "count": count,
+            "errors": endpoint["errors"],
+            "p50_ms": round(_percentile(endpoint["latency"], 0.50) * 1000, 3),
+            "p95_ms": round(_percentile(endpoint["latency"], 0.95) * 1000, 3),
+            "p99_ms": round(_percentile(endpoint["latency"], 0.99) * 1000, 3),
+            "throughput_rps": round(count / elapsed, 1),
+            "sql_per_request": round(endpoint["sql"] / count, 2),
+        }
+    total = {"count": len(records), "elapsed_s": round(elapsed, 3),
+             "throughput_rps": round(len(records) / elapsed, 1) if elapsed else 0.0}
+    return {"endpoints": result, "total": total}
+
+
+def compare(result: dict, baseline: dict, tolerance: float, min_ms: float = 1.0):
+    '''
+    baseline 비교 함수
+
+    endpoint별 p95 응답 시간이 (1 + tolerance)배와 min_ms를 모두 넘게 증가하거나, 요청당 SQL 수가 증가하거나,
+    전체 처리량이 (1 - tolerance)배 미만으로 감소하면 regression으로 판단
+
+        Returns:
+            regression 설명 목록
+    '''
+    regressions = []
+    for name, base in baseline["endpoints"].items():
+        current = result["endpoints"].get(name)
+        if current is None:
+            continue
+        if current["p95_ms"] > base["p95_ms"] * (1 + tolerance) and current["p95_ms"] - base["p95_ms"] > min_ms:
+            regressions.append(f"{name}: p95 {base['p95_ms']}ms -> {current['p95_ms']}ms")
+        if current["sql_per_request"] > base["sql_per_request"] + 0.5:
+            regressions.append(f"{name}: SQL/request {base['sql_per_request']} -> {current['sql_per_request']}")
+    base_rps = baseline["total"]["throughput_rps"]
+    if result["total"]["throughput_rps"] < base_rps * (1 - tolerance):
+        regressions.append(f"throughput {base_rps} -> {result['total']['throughput_rps']} req/s")
+    return regressions
+
+
+def _configure(args):
+    '''
+    app을 import하기 전에 benchmark용 설정과 redis 대체를 적용
+    '''
+    url = args.url or f"sqlite+aiosqlite:///{os.path.join(tempfile.mkdtemp(), 'load_test.db')}"
+    os.environ["SQLALCHEMY_DATABASE_URL"] = url
+    os.environ.setdefault("ACCESS_TOKEN_EXPIRE_SECONDS", "3600")
+    os.environ.setdefault("BCRYPT_ROUNDS", "4")
+    os.environ.setdefault("PAGE_SIZE", "20")
+    os.environ.setdefault("QUERY_BUDGET_MODE", "raise")
+    if args.real_redis:
+        return
+    import fakeredis
+    from fakeredis.aioredis import FakeConnection
+    from redis import asyncio as aioredis
+
+    import src.core.redis_config as redis_config
+    from src.core.metrics import InstrumentedRedis
+    server = fakeredis.FakeServer()
+
+    def init_fake_redis():
+        redis_config._pool = aioredis.BlockingConnectionPool(connection_class=FakeConnection, server=server,
+                                                             max_connections=50)
+        redis_config._client = InstrumentedRedis(connection_pool=redis_config._pool)
+
+    redis_config.init_redis = init_fake_redis
+
+
+async def run(args):
+    import httpx
+    from sqlalchemy import event
+
+    from benchmarks.seed import seed
+    from src.core.db_config import engine
+    from src.core.redis_config import init_redis, close_redis, get_redis
+    from src.utils.config import get_settings
+
+    started = time.perf_counter()
+    # 유저 비밀번호를 다른 cost로 저장하여 첫 로그인의 rehash 경로도 query budget 안에서 실행되는지 확인
+    data = await seed(engine, args.users, args.boards, args.posts, args.skew, seed_value=args.seed,
+                      password_rounds=get_settings().BCRYPT_ROUNDS + 1)
+    print(f"seeded {len(data.users)} users, {len(data.boards)} boards, {len(data.posts)} posts "
+          f"in {time.perf_counter() - started:.1f}s", file=sys.stderr)
+    if args.real_redis:
+        init_redis()
+        await (await get_redis()).flushdb()
+        await close_redis()
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def count_sql(*_):
+        counter = _sql_counter.get()
+        if counter is not None:
+            counter[0] += 1
+
+    import main
+    rng = random.Random(args.seed)
+    weights = WORKLOADS[args.workload]
+    names = list(weights)
+    records = []
+    remaining = args.warmup + args.requests
+
+    async with main.app.router.lifespan_context(main.app):
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+            ctx = Context(data=data)
+            for user in range(min(args.login_users, len(data.users))):
+                response = await client.post("/user/login", data={"username": data.users[user], "password": "benchmark"})
+                ctx.tokens[user] = response.json()["access_token"]
+                ctx.visible[user] = [b for b in data.boards if b in data.public_boards or data.boards[b] == user]
+
+            async def worker():
+                nonlocal remaining
+                while remaining > 0:
+                    remaining -= 1
+                    warmup = remaining >= args.requests
+                    name = rng.choices(names, weights=list(weights.values()))[0]
+                    user, method, url, kwargs = _request(name, ctx, rng)
+                    headers = {"Authorization": f"Bearer {ctx.tokens[user]}"} if user is not None else {}
+                    counter = [0]
+                    token = _sql_counter.set(counter)
+                    begin = time.perf_counter()
+                    try:
+                        response = await client.request(method, url, headers=headers, **kwargs)
+                    finally:
+                        _sql_counter.reset(token)
+                    latency = time.perf_counter() - begin
+                    if not warmup:
+                        records.append((name, latency, response.status_code, counter[0]))
+
+            started = time.perf_counter()
+            await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+            elapsed = time.perf_counter() - started
+
+    result = summarize(records, elapsed)
+    result["config"] = {k: v for k, v in vars(args).items() if k not in ("output", "baseline", "save_baseline")}
+    result["config"]["url"] = os.environ["SQLALCHEMY_DATABASE_URL"].split("@")[-1]
+    return result
+
+
+def _print(result: dict):
+    print(f"{'endpoint':<20}{'count':>7}{'err':>6}{'p50(ms)':>10}{'p95(ms)':>10}{'p99(ms)':>10}{'req/s':>9}{'SQL/req':>9}")
+    for name, e in result["endpoints"].items():
+        print(f"{name:<20}{e['count']:>7}{e['errors']:>6}{e['p50_ms']:>10.2f}{e['p95_ms']:>10.2f}"
+              f"{e['p99_ms']:>10.2f}{e['throughput_rps']:>9.1f}{e['sql_per_request']:>9.2f}")
+    total = result["total"]
+    print(f"total {total['count']} requests in {total['elapsed_s']}s ({total['throughput_rps']} req/s)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="endpoint load test")
+    parser.add_argument("--workload", choices=sorted(WORKLOADS), default="mixed", help="요청 구성")
+    parser.add_argument("--requests", type=int, default=2000, help="측정할 요청 수")
+    parser.add_argument("--warmup", type=int, default=200, help="측정 전에 실행할 요청 수")
+    parser.add_argument("--concurrency", type=int, default=16, help="동시에 요청하는 client 수")
+    parser.add_argument("--users", type=int, default=100, help="생성할 유저 수")
+    parser.add_argument("--boards", type=int, default=200, help="생성할 게시판 수")
+    parser.add_argument("--posts", type=int, default=20000, help="생성할 게시글 수")
+    parser.add_argument("--skew", type=float, default=1.1, help="게시판별 게시글 수 Zipf 지수 (클수록 치우침)")
+    parser.add_argument("--login-users", type=int, default=32, help="요청에 사용할 로그인 유저 수")
+    parser.add_argument("--seed", type=int, default=0, help="난수 seed")
+    parser.add_argument("--url", default=None, help="benchmark용 DB 주소 (기본값: 임시 SQLite 파일)")
+    parser.add_argument("--real-redis", action="store_true", help="fakeredis 대신 .env의 redis 사용 (FLUSHDB 실행)")
+    parser.add_argument("--output", default=None, help="결과 JSON 저장 경로")
+    parser.add_argument("--baseline", default=None, help="비교할 baseline JSON 경로")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="baseline 대비 허용 오차 비율")
+    parser.add_argument("--save-baseline", default=None, help="결과를 baseline으로 저장할 경로")
+    args = parser.parse_args()
+
+    _configure(args)
+    result = asyncio.run(run(args))
+    _print(result)
+    for path in (args.output, args.save_baseline):
+        if path:
+            with open(path, "w") as f:
+                json.dump(result, f, indent=2)
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(result, json.load(f), args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
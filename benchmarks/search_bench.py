@@ -0,0 +1,113 @@
+'''
+게시글 검색 benchmark
+
+게시글 수를 늘려 가며 전문 검색 인덱스(SQLite FTS5 / PostgreSQL GIN)를 사용하는 search_posts와
+인덱스 없이 LIKE로 전체 게시글을 탐색하는 쿼리의 응답 시간을 비교
+일치하는 게시글 수가 같다면 인덱스 검색의 응답 시간은 전체 게시글 수에 거의 영향을 받지 않음
+
+    python -m benchmarks.search_bench [--sizes 1000 10000 100000] [--url sqlite+aiosqlite:///search_bench.db]
+
+--url로 지정한 DB에 table을 생성하고 게시글을 추가하므로 운영 DB를 지정하지 않도록 주의
+'''
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import tempfile
+import time
+
+os.environ.setdefault("SQLALCHEMY_DATABASE_URL", "sqlite+aiosqlite://")
+
+from sqlalchemy import select, insert
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+from src.core.db_config import Base
+from src.core.models import User, Board, Post
+from src.utils.excerpt import make_excerpt
+from src.utils.search import search_posts
+
+NEEDLE = "needle"
+NEEDLE_POSTS = 20
+PAGE_SIZE = 20
+
+
+def _content(rng: random.Random, words: int, vocabulary: int):
+    return " ".join(f"w{rng.randrange(vocabulary)}" for _ in range(words))
+
+
+async def _seed(db, start: int, stop: int, rng: random.Random, vocabulary: int, batch_size: int = 5000):
+    '''
+    start번째부터 stop번째까지의 게시글 추가, 처음 NEEDLE_POSTS개의 게시글에만 NEEDLE 단어 포함
+    '''
+    for batch_start in range(start, stop, batch_size):
+        rows = []
+        for i in range(batch_start, min(batch_start + batch_size, stop)):
+            content = _content(rng, 50, vocabulary)
+            if i < NEEDLE_POSTS:
+                content += f" {NEEDLE}"
+            rows.append({"board_id": 1, "user_id": 1, "title": f"post {i}",
+                         "content": content, "excerpt": make_excerpt(content)})
+        await db.execute(insert(Post), rows)
+    await db.commit()
+
+
+async def _measure(fn, repeat: int):
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await fn()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples)
+
+
+async def run(url: str, sizes: list[int], repeat: int, vocabulary: int):
+    engine = create_async_engine(url)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    rng = random.Random(0)
+
+    print(f"{'posts':>10}{'search(ms)':>12}{'like(ms)':>12}{'matches':>10}")
+    async with session_factory() as db:
+        db.add(User(id=1, fullname="bench", email="bench@example.com", password="-"))
+        db.add(Board(id=1, name="bench", public=True, user_id=1, post_count=0))
+        await db.commit()
+        seeded = 0
+        for size in sorted(sizes):
+            await _seed(db, seeded, size, rng, vocabulary)
+            seeded = size
+
+            async def indexed():
+                return await search_posts(NEEDLE, 1, db, PAGE_SIZE)
+
+            async def scan():
+                _query = (select(Post.id, Post.title, Post.excerpt)
+                          .filter(Post.content.like(f"%{NEEDLE}%"))
+                          .order_by(Post.id.desc()).limit(PAGE_SIZE + 1))
+                return (await db.execute(_query)).all()
+
+            matches = len(await indexed())
+            search_ms = await _measure(indexed, repeat) * 1000
+            like_ms = await _measure(scan, repeat) * 1000
+            print(f"{size:>10}{search_ms:>12.2f}{like_ms:>12.2f}{matches:>10}")
+    await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="게시글 검색 응답 시간 측정")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000], help="측정할 게시글 수")
+    parser.add_argument("--repeat", type=int, default=20, help="게시글 수별 반복 횟수")
+    parser.add_argument("--vocabulary", type=int, default=20000, help="게시글 내용에 사용할 단어 수")
+    parser.add_argument("--url", default=None, help="benchmark용 DB 주소 (기본값: 임시 SQLite 파일)")
+    args = parser.parse_args()
+
+    url = args.url
+    if url is None:
+        url = f"sqlite+aiosqlite:///{os.path.join(tempfile.mkdtemp(), 'search_bench.db')}"
+    asyncio.run(run(url, args.sizes, args.repeat, args.vocabulary))
+
+
+if __name__ == "__main__":
+    main()
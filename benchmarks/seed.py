@@ -0,0 +1,125 @@
+'''
+benchmark용 데이터 생성
+
+N명의 유저, 게시판, 게시글을 생성하며 게시판별 게시글 수는 Zipf 분포로 치우치게 생성
+(소수의 게시판에 게시글이 몰리는 실제 서비스와 비슷한 분포)
+'''
+import random
+from dataclasses import dataclass, field
+
+from passlib.context import CryptContext
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.core.db_config import Base
+from src.core.models import User, Board, Post
+from src.utils.config import get_settings
+from src.utils.excerpt import make_excerpt
+
+PASSWORD = "benchmark"
+
+_WORDS = ("fastapi", "redis", "board", "post", "cache", "index", "query", "async", "latency", "feed",
+          "search", "python", "sqlalchemy", "postgres", "benchmark", "cursor", "page", "count", "view", "token")
+
+
+@dataclass
+class Dataset:
+    '''
+    생성된 데이터 정보, workload가 요청할 ID를 고를 때 사용
+
+        Attributes:
+            users (list[str]): 유저 이메일 목록 (비밀번호는 PASSWORD)
+            boards (dict[int, int]): {게시판 ID: 게시판을 생성한 유저 순번}
+            public_boards (list[int]): 공개 게시판 ID 목록
+            board_posts (dict[int, list[int]]): {게시판 ID: 게시글 ID 목록}
+            posts (list[int]): 전체 게시글 ID 목록
+            user_posts (dict[int, list[int]]): {유저 순번: 작성한 게시글 ID 목록}
+    '''
+    users: list[str] = field(default_factory=list)
+    boards: dict[int, int] = field(default_factory=dict)
+    public_boards: list[int] = field(default_factory=list)
+    board_posts: dict[int, list[int]] = field(default_factory=dict)
+    posts: list[int] = field(default_factory=list)
+    user_posts: dict[int, list[int]] = field(default_factory=dict)
+
+
+def zipf_sizes(total: int, buckets: int, skew: float, rng: random.Random):
+    '''
+    total개를 buckets개로 나누되, i번째 bucket의 크기가 1 / i^skew에 비례하도록 분배 (순서는 섞음)
+    '''
+    weights = [1 / (i + 1) ** skew for i in range(buckets)]
+    scale = total / sum(weights)
+    sizes = [int(w * scale) for w in weights]
+    for i in range(total - sum(sizes)):
+        sizes[i % buckets] += 1
+    rng.shuffle(sizes)
+    return sizes
+
+
+def _content(rng: random.Random, words: int):
+    return " ".join(rng.choice(_WORDS) for _ in range(words))
+
+
+async def seed(engine: AsyncEngine, users: int, boards: int, posts: int, skew: float,
+               private_ratio: float = 0.2, content_words: int = 80, seed_value: int = 0,
+               password_rounds: int | None = None):
+    '''
+    benchmark DB 초기화 및 데이터 생성 함수
+
+    기존 table을 모두 삭제하고 다시 생성한 후 데이터를 추가하므로 benchmark 전용 DB에서만 사용
+    password_rounds를 BCRYPT_ROUNDS와 다르게 지정하면 유저의 첫 로그인에서 비밀번호 rehash가 실행됨
+
+        Returns:
+            생성된 데이터 정보 (Dataset)
+    '''
+    rng = random.Random(seed_value)
+    data = Dataset()
+    hashed = CryptContext(schemes=["bcrypt"]).hash(PASSWORD, rounds=password_rounds or get_settings().BCRYPT_ROUNDS)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+        data.users = [f"user{i}@bench.local" for i in range(users)]
+        user_ids = (await conn.scalars(insert(User).returning(User.id, sort_by_parameter_order=True), [
+            {"fullname": f"user {i}", "email": email, "password": hashed}
+            for i, email in enumerate(data.users)
+        ])).all()
+
+        sizes = zipf_sizes(posts, boards, skew, rng)
+        owners = [rng.randrange(users) for _ in range(boards)]
+        publics = [rng.random() >= private_ratio for _ in range(boards)]
+        board_ids = (await conn.scalars(insert(Board).returning(Board.id, sort_by_parameter_order=True), [
+            {"name": f"board {i}", "public": publics[i], "user_id": user_ids[owners[i]], "post_count": sizes[i]}
+            for i in range(boards)
+        ])).all()
+        for board_id, owner, public in zip(board_ids, owners, publics):
+            data.boards[board_id] = owner
+            data.board_posts[board_id] = []
+            if public:
+                data.public_boards.append(board_id)
+
+        batch = []
+        authors = []
+
+        async def flush():
+            stmt = insert(Post).returning(Post.id, Post.board_id, sort_by_parameter_order=True)
+            for (post_id, board_id), author in zip(await conn.execute(stmt, batch), authors):
+                data.board_posts[board_id].append(post_id)
+                data.posts.append(post_id)
+                data.user_posts.setdefault(author, []).append(post_id)
+            batch.clear()
+            authors.clear()
+
+        for board_id, size in zip(board_ids, sizes):
+            for _ in range(size):
+                content = _content(rng, content_words)
+                authors.append(rng.randrange(users))
+                batch.append({"board_id": board_id, "user_id": user_ids[authors[-1]],
+                              "title": f"post {rng.choice(_WORDS)} {rng.choice(_WORDS)}", "content": content,
+                              "excerpt": make_excerpt(content)})
+                if len(batch) >= 5000:
+                    await flush()
+        if batch:
+            await flush()
+    return data
@@ -0,0 +1,77 @@
+'''
+응답 직렬화 microbenchmark
+
+ORM 객체를 그대로 반환하던 기존 방식(jsonable_encoder + JSONResponse)과
+응답 Schema + ORJSONResponse 방식의 응답 1회당 직렬화 시간을 비교
+
+    python -m benchmarks.serialization_bench [--posts 20] [--content-size 2000] [--repeat 2000]
+'''
+import argparse
+import os
+import timeit
+
+os.environ.setdefault("SQLALCHEMY_DATABASE_URL", "sqlite+aiosqlite://")
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, ORJSONResponse
+from pydantic import TypeAdapter
+
+from src.core.models import Board, Post
+from src.domain.board import board_schema
+from src.domain.post import post_schema
+from src.utils.excerpt import make_excerpt
+
+
+def _make_objects(posts: int, content_size: int):
+    '''
+    DB 없이 직렬화할 게시판과 게시글 ORM 객체 생성
+    '''
+    board = Board(id=1, name="board", public=True, user_id=1, post_count=posts)
+    post_list = [
+        Post(id=i, board_id=1, user_id=1, title=f"title {i}", content="x" * content_size,
+             excerpt=make_excerpt("x" * content_size))
+        for i in range(1, posts + 1)
+    ]
+    return board, post_list
+
+
+def _orm_response(content):
+    '''
+    response_model 없이 ORM 객체를 반환할 때 FastAPI가 수행하는 직렬화
+    '''
+    return JSONResponse(jsonable_encoder(content)).body
+
+
+def _schema_response(adapter: TypeAdapter, content):
+    '''
+    response_model과 ORJSONResponse를 사용할 때 FastAPI가 수행하는 직렬화
+    '''
+    return ORJSONResponse(adapter.dump_python(adapter.validate_python(content), mode="json")).body
+
+
+def main():
+    parser = argparse.ArgumentParser(description="응답 직렬화 시간 비교")
+    parser.add_argument("--posts", type=int, default=20, help="목록 응답의 게시글 수 (PAGE_SIZE)")
+    parser.add_argument("--content-size", type=int, default=2000, help="게시글 content 길이")
+    parser.add_argument("--repeat", type=int, default=2000, help="응답별 반복 횟수")
+    args = parser.parse_args()
+
+    board, post_list = _make_objects(args.posts, args.content_size)
+    cases = [
+        ("board_detail", board, board_schema.BoardOut),
+        ("post_detail", post_list[0], post_schema.PostOut),
+        ("board_list", {"board_count": 1, "board_list": [board] * args.posts}, board_schema.BoardList),
+        ("post_list", {"post_count": args.posts, "post_list": post_list}, post_schema.PostList),
+    ]
+
+    print(f"{'response':<14}{'before(us)':>12}{'after(us)':>12}{'speedup':>10}{'before(B)':>12}{'after(B)':>12}")
+    for name, content, schema in cases:
+        adapter = TypeAdapter(schema)
+        before = timeit.timeit(lambda: _orm_response(content), number=args.repeat) / args.repeat
+        after = timeit.timeit(lambda: _schema_response(adapter, content), number=args.repeat) / args.repeat
+        print(f"{name:<14}{before * 1e6:>12.1f}{after * 1e6:>12.1f}{before / after:>9.1f}x"
+              f"{len(_orm_response(content)):>12}{len(_schema_response(adapter, content)):>12}")
+
+
+if __name__ == "__main__":
+    main()
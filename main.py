@@ -1,11 +1,57 @@
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
+from src.core.db_config import engine
+from src.core.metrics import MetricsMiddleware
+from src.core.profiling import ProfilingMiddleware, listen_profiler_config
+from src.core.query_budget import QueryBudgetMiddleware
+from src.core.redis_config import init_redis, close_redis, get_redis
 from src.domain.board import board_router
+from src.domain.monitor import monitor_router
 from src.domain.post import post_router
 from src.domain.user import user_router
+from src.utils.config import get_settings
+from src.utils.board_rank import ensure_board_rank
+from src.utils.feed import ensure_feeds
+from src.utils.counters import run_counter_flusher
+from src.utils.password import init_password_pool, close_password_pool
+from src.utils.token_cache import listen_token_invalidation
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    '''
+    앱 실행 및 종료 시 공유 자원 관리
+    '''
+    get_settings()
+    init_redis()
+    init_password_pool()
+    await ensure_board_rank(await get_redis())
+    await ensure_feeds(await get_redis())
+    tasks = [
+        asyncio.create_task(listen_token_invalidation(await get_redis())),
+        asyncio.create_task(run_counter_flusher(await get_redis())),
+        asyncio.create_task(listen_profiler_config(await get_redis())),
+    ]
+    yield
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    close_password_pool()
+    await close_redis()
+    await engine.dispose()
+
 
-app = FastAPI()
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
+app.add_middleware(ProfilingMiddleware)
+app.add_middleware(QueryBudgetMiddleware)
+app.add_middleware(MetricsMiddleware)
 
 app.include_router(user_router.router, tags=["User"])
 app.include_router(board_router.router, tags=["Board"])
 app.include_router(post_router.router, tags=["Post"])
+app.include_router(monitor_router.router, tags=["Monitor"])
+app.include_router(monitor_router.metrics_router, tags=["Monitor"])
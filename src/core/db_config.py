@@ -1,21 +1,110 @@
-from sqlalchemy import create_engine
+import time
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool, AsyncAdaptedQueuePool
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
 
-from src.utils.config import Settings
+from src.core.metrics import Counter, Gauge, Histogram, instrument_engine
+from src.utils.config import get_settings
+
+pool_wait = Histogram("db_pool_checkout_wait_seconds", "DB connection pool에서 연결을 가져오기까지 대기한 시간")
+pool_timeouts = Counter("db_pool_checkout_timeouts_total", "DB connection pool 대기 시간 초과 횟수")
+_pool_wait = {"count": 0, "total_seconds": 0.0, "max_seconds": 0.0, "timeouts": 0}
+
+
+class TimedQueuePool(AsyncAdaptedQueuePool):
+    '''
+    연결 대기 시간 기록 connection pool
+
+    세션이 실제로 SQL을 실행하기 위해 연결을 가져올 때만 pool에서 연결을 가져오고,
+    가져오기까지 대기한 시간(새 연결 생성 포함)과 pool_timeout 초과 횟수를 기록
+    '''
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            pool_timeouts.inc()
+            _pool_wait["timeouts"] += 1
+            raise
+        finally:
+            waited = time.perf_counter() - start
+            pool_wait.observe(waited)
+            _pool_wait["count"] += 1
+            _pool_wait["total_seconds"] += waited
+            _pool_wait["max_seconds"] = max(_pool_wait["max_seconds"], waited)
+
+
+def _engine_options(settings):
+    '''
+    connection pool 설정 함수
+
+    SQLite는 connection pool 크기 설정을 지원하지 않으므로 기본 설정을 사용
+    '''
+    if make_url(settings.SQLALCHEMY_DATABASE_URL).get_backend_name() == "sqlite":
+        return {}
+    return {
+        "poolclass": TimedQueuePool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+    }
 
-engine = create_engine(Settings().SQLALCHEMY_DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+engine = create_async_engine(get_settings().SQLALCHEMY_DATABASE_URL, **_engine_options(get_settings()))
+instrument_engine(engine)
+SessionLocal = async_sessionmaker(autoflush=False, expire_on_commit=False, bind=engine)
 
 Base = declarative_base()
 
 
-def get_db():
+def _pool_gauge(read):
+    def gauge():
+        pool = engine.pool
+        return read(pool) if isinstance(pool, QueuePool) else 0
+    return gauge
+
+
+Gauge("db_pool_checked_out", "사용 중인 DB 연결 수", _pool_gauge(lambda pool: pool.checkedout()))
+Gauge("db_pool_overflow", "pool_size를 초과하여 생성된 DB 연결 수", _pool_gauge(lambda pool: max(pool.overflow(), 0)))
+
+
+async def get_db():
     '''
     DB 세션 관리 함수
+
+    요청마다 세션을 생성, 연결은 세션이 처음 SQL을 실행할 때 pool에서 가져오므로
+    캐시 적중이나 304 응답처럼 SQL을 실행하지 않는 요청은 연결을 사용하지 않음
+    예외 발생 시 rollback하고 요청이 끝나면 항상 세션을 종료
+    '''
+    async with SessionLocal() as db:
+        try:
+            yield db
+        except:
+            await db.rollback()
+            raise
+
+
+def get_db_pool_stats():
+    '''
+    DB connection pool 상태 조회 함수
+
+        Returns:
+            size (int): pool 기본 연결 수
+            checked_out (int): 사용 중인 연결 수
+            overflow (int): pool_size를 초과하여 생성된 연결 수
+            wait (dict): 연결을 가져오기까지 대기한 횟수, 누적 시간, 최대 시간 (초), 대기 시간 초과 횟수
     '''
-    db = SessionLocal()
-    try:
-        yield db
-    except:
-        db.close()
\ No newline at end of file
+    pool = engine.pool
+    stats = {"wait": dict(_pool_wait)}
+    if isinstance(pool, QueuePool):
+        stats.update({
+            "size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "overflow": max(pool.overflow(), 0),
+        })
+    return stats
@@ -0,0 +1,270 @@
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from redis import asyncio as aioredis
+from redis.asyncio.client import Pipeline
+from sqlalchemy import event
+
+DURATION_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+COUNT_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 50, 100)
+
+_registry = []
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names, values, extra=""):
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class Counter:
+    '''
+    Prometheus counter
+
+        Attributes:
+            name (str): metric 이름
+            help (str): metric 설명
+            labelnames (tuple): label 이름 목록
+    '''
+    def __init__(self, name: str, help: str, labelnames: tuple = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = labelnames
+        self._values = {}
+        _registry.append(self)
+
+    def inc(self, *labels, amount: float = 1):
+        self._values[labels] = self._values.get(labels, 0) + amount
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        for labels, value in self._values.items():
+            lines.append(f"{self.name}{_format_labels(self.labelnames, labels)} {value}")
+        return lines
+
+
+class Gauge:
+    '''
+    Prometheus gauge
+
+    값을 저장하지 않고 metric 조회 시 함수를 호출하여 현재 값을 출력
+
+        Attributes:
+            name (str): metric 이름
+            help (str): metric 설명
+            read: 현재 값을 반환하는 함수
+    '''
+    def __init__(self, name: str, help: str, read):
+        self.name = name
+        self.help = help
+        self.read = read
+        _registry.append(self)
+
+    def render(self):
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} gauge", f"{self.name} {self.read()}"]
+
+
+class Histogram:
+    '''
+    Prometheus histogram
+
+    label 조합마다 bucket별 관측 수, 합계, 관측 수만 저장하므로 관측 값 수와 관계없이 일정한 메모리 사용
+
+        Attributes:
+            name (str): metric 이름
+            help (str): metric 설명
+            labelnames (tuple): label 이름 목록
+            buckets (tuple): bucket 상한 목록 (오름차순)
+    '''
+    def __init__(self, name: str, help: str, labelnames: tuple = (), buckets: tuple = DURATION_BUCKETS):
+        self.name = name
+        self.help = help
+        self.labelnames = labelnames
+        self.buckets = buckets
+        self._values = {}
+        _registry.append(self)
+
+    def observe(self, value: float, *labels):
+        entry = self._values.get(labels)
+        if entry is None:
+            entry = self._values[labels] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+        entry[0][bisect_left(self.buckets, value)] += 1
+        entry[1] += value
+        entry[2] += 1
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        for labels, (counts, total, count) in self._values.items():
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                le = _format_labels(self.labelnames, labels, f'le="{bound}"')
+                lines.append(f"{self.name}_bucket{le} {cumulative}")
+            le = _format_labels(self.labelnames, labels, 'le="+Inf"')
+            lines.append(f"{self.name}_bucket{le} {count}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, labels)} {total}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, labels)} {count}")
+        return lines
+
+
+def render_metrics():
+    '''
+    등록된 모든 metric을 Prometheus text 형식으로 반환
+    '''
+    lines = []
+    for metric in _registry:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
+
+
+http_requests = Counter("http_requests_total", "HTTP 요청 수", ("method", "route", "status"))
+http_duration = Histogram("http_request_duration_seconds", "HTTP 요청 처리 시간", ("method", "route"))
+http_sql_statements = Histogram("http_request_sql_statements", "HTTP 요청당 SQL 실행 수", ("route",), COUNT_BUCKETS)
+http_sql_duration = Histogram("http_request_sql_duration_seconds", "HTTP 요청당 SQL 실행 시간 합계", ("route",))
+http_redis_commands = Histogram("http_request_redis_commands", "HTTP 요청당 redis 왕복 수", ("route",), COUNT_BUCKETS)
+http_redis_duration = Histogram("http_request_redis_duration_seconds", "HTTP 요청당 redis 왕복 시간 합계", ("route",))
+sql_duration = Histogram("sql_statement_duration_seconds", "SQL 실행 시간 (background 작업 포함)")
+redis_duration = Histogram("redis_command_duration_seconds", "redis 명령 왕복 시간 (pipeline은 1회)", ("command",))
+redis_errors = Counter("redis_command_errors_total", "redis 명령 오류 수", ("command",))
+single_flight_calls = Counter("single_flight_calls_total", "동일 조회 병합 layer 호출 수", ("kind",))
+single_flight_shared = Counter("single_flight_shared_total", "다른 조회의 결과를 공유한 호출 수", ("kind",))
+
+
+@dataclass(slots=True)
+class RequestStats:
+    '''
+    요청 하나에서 실행된 SQL, redis 명령 수와 시간
+    shapes에는 SQL 문장별 실행 횟수를 기록 (N+1 감지 시 사용)
+    statements가 None이 아니면 실행된 SQL과 실행 시간을 (초, SQL) 형태로 기록 (profiling 시 사용)
+    '''
+    sql_count: int = 0
+    sql_seconds: float = 0.0
+    redis_count: int = 0
+    redis_seconds: float = 0.0
+    shapes: dict[str, int] = field(default_factory=dict)
+    statements: list | None = None
+
+
+_request_stats: ContextVar[RequestStats | None] = ContextVar("request_stats", default=None)
+
+
+def current_request_stats():
+    '''
+    처리 중인 요청의 RequestStats 조회, 요청 처리 중이 아니면 None
+    '''
+    return _request_stats.get()
+
+
+def instrument_engine(engine):
+    '''
+    SQLAlchemy engine event hook 등록 함수
+
+    SQL 실행 시간을 기록하고, 요청 처리 중인 경우 요청의 SQL 실행 수와 시간에 더함
+    '''
+    sync_engine = getattr(engine, "sync_engine", engine)
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("metrics_started", []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["metrics_started"].pop()
+        sql_duration.observe(elapsed)
+        stats = _request_stats.get()
+        if stats is not None:
+            stats.sql_count += 1
+            stats.sql_seconds += elapsed
+            stats.shapes[statement] = stats.shapes.get(statement, 0) + 1
+            if stats.statements is not None:
+                stats.statements.append((elapsed, statement))
+
+
+def _record_redis(command: str, elapsed: float):
+    redis_duration.observe(elapsed, command)
+    stats = _request_stats.get()
+    if stats is not None:
+        stats.redis_count += 1
+        stats.redis_seconds += elapsed
+
+
+class InstrumentedPipeline(Pipeline):
+    '''
+    실행(execute) 한 번을 redis 왕복 한 번으로 기록하는 pipeline
+    '''
+    async def execute(self, raise_on_error: bool = True):
+        started = time.perf_counter()
+        try:
+            return await super().execute(raise_on_error)
+        except Exception:
+            redis_errors.inc("PIPELINE")
+            raise
+        finally:
+            _record_redis("PIPELINE", time.perf_counter() - started)
+
+
+class InstrumentedRedis(aioredis.Redis):
+    '''
+    명령별 실행 수와 왕복 시간을 기록하는 redis client
+    '''
+    async def execute_command(self, *args, **options):
+        started = time.perf_counter()
+        command = str(args[0]).upper() if args else ""
+        try:
+            return await super().execute_command(*args, **options)
+        except Exception:
+            redis_errors.inc(command)
+            raise
+        finally:
+            _record_redis(command, time.perf_counter() - started)
+
+    def pipeline(self, transaction: bool = True, shard_hint=None):
+        return InstrumentedPipeline(self.connection_pool, self.response_callbacks, transaction, shard_hint)
+
+
+class MetricsMiddleware:
+    '''
+    요청 metric 기록 ASGI middleware
+
+    route(경로 template)별 처리 시간, 상태 코드, 요청당 SQL 실행 수와 시간, redis 왕복 수와 시간을 기록
+    경로 parameter 값 대신 route template을 label로 사용하여 label 수가 endpoint 수로 제한됨
+    '''
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        stats = RequestStats()
+        token = _request_stats.set(stats)
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            _request_stats.reset(token)
+            route = scope.get("route")
+            path = getattr(route, "path", "unmatched")
+            method = scope["method"]
+            http_requests.inc(method, path, status_code)
+            http_duration.observe(elapsed, method, path)
+            http_sql_statements.observe(stats.sql_count, path)
+            http_sql_duration.observe(stats.sql_seconds, path)
+            http_redis_commands.observe(stats.redis_count, path)
+            http_redis_duration.observe(stats.redis_seconds, path)
@@ -1,5 +1,5 @@
-from sqlalchemy import Column, Integer, String, Text, Boolean, ForeignKey
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, Text, Boolean, ForeignKey, Index, DDL, event, func, text
+from sqlalchemy.orm import relationship, backref, deferred
 
 from src.core.db_config import Base
 
@@ -42,6 +42,11 @@ class Board(Base):
     user_id = Column(Integer, ForeignKey("user.id"), nullable=False)
     post_count = Column(Integer, default=0, nullable=False)
 
+    __table_args__ = (
+        Index("ix_board_post_count_id", "post_count", "id"),
+        Index("ix_board_user_id_public", "user_id", "public"),
+    )
+
 
 class Post(Base):
     '''
@@ -51,15 +56,47 @@ class Post(Base):
             id (int): primary key
             board_id (int): foreign key, Board 객체의 ID
             title (str): 게시글의 제목
-            content (str): 게시글의 내용
+            content (str): 게시글의 내용 (deferred, 상세 조회 시에만 로드)
+            excerpt (str): 목록 조회용 게시글 요약
+            view_count (int): 게시글 조회수 (redis에 누적된 조회수를 주기적으로 반영)
             user_id (int): 게시글을 생성한 유저의 ID
             board (Board): post가 작성된 board 객체
+                (lazy loading 시 숨은 SQL이 실행되지 않도록 접근 시 예외 발생, 필요하면 명시적으로 조회)
     '''
     __tablename__ = "post"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     board_id = Column(Integer, ForeignKey("board.id"), nullable=False)
     title = Column(String, nullable=False)
-    content = Column(Text, nullable=False)
+    content = deferred(Column(Text, nullable=False))
+    excerpt = Column(String, nullable=False, server_default="", default="")
+    view_count = Column(Integer, nullable=False, server_default="0", default=0)
     user_id = Column(Integer, ForeignKey("user.id"), nullable=False)
-    board = relationship("Board", backref="posts")
\ No newline at end of file
+    board = relationship("Board", backref=backref("posts", lazy="raise", passive_deletes="all"), lazy="raise")
+
+    __table_args__ = (
+        Index("ix_post_board_id_id", "board_id", "id"),
+    )
+
+
+# 게시글 검색용 tsvector 식, 검색 쿼리도 같은 식을 사용해야 GIN 인덱스가 사용됨
+post_search_vector = func.to_tsvector(
+    text("'simple'::regconfig"),
+    Post.__table__.c.title + text("' '") + Post.__table__.c.content,
+)
+
+Index("ix_post_search", post_search_vector, postgresql_using="gin").ddl_if(dialect="postgresql")
+
+# SQLite(로컬 실행)는 post를 content table로 사용하는 FTS5 table을 trigger로 동기화
+for _ddl in (
+    "CREATE VIRTUAL TABLE post_fts USING fts5(title, content, content='post', content_rowid='id')",
+    "CREATE TRIGGER post_fts_ai AFTER INSERT ON post BEGIN "
+    "INSERT INTO post_fts(rowid, title, content) VALUES (new.id, new.title, new.content); END",
+    "CREATE TRIGGER post_fts_ad AFTER DELETE ON post BEGIN "
+    "INSERT INTO post_fts(post_fts, rowid, title, content) VALUES ('delete', old.id, old.title, old.content); END",
+    "CREATE TRIGGER post_fts_au AFTER UPDATE OF title, content ON post BEGIN "
+    "INSERT INTO post_fts(post_fts, rowid, title, content) VALUES ('delete', old.id, old.title, old.content); "
+    "INSERT INTO post_fts(rowid, title, content) VALUES (new.id, new.title, new.content); END",
+):
+    event.listen(Post.__table__, "after_create", DDL(_ddl).execute_if(dialect="sqlite"))
+event.listen(Post.__table__, "before_drop", DDL("DROP TABLE IF EXISTS post_fts").execute_if(dialect="sqlite"))
@@ -0,0 +1,265 @@
+import asyncio
+import itertools
+import json
+import logging
+import random
+import time
+from collections import deque
+from dataclasses import dataclass, asdict
+
+from pyinstrument import Profiler
+from pyinstrument.renderers import ConsoleRenderer, HTMLRenderer, SpeedscopeRenderer
+from redis.asyncio import Redis
+
+from src.core.metrics import current_request_stats
+from src.utils.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+PROFILER_CONFIG_KEY = "monitor:profiler:config"
+PROFILER_CONFIG_CHANNEL = "monitor:profiler:config"
+PROFILE_TOP_STATEMENTS = 10
+
+RENDERERS = {
+    "speedscope": (lambda: SpeedscopeRenderer(), "application/json"),
+    "html": (lambda: HTMLRenderer(), "text/html; charset=utf-8"),
+    "text": (lambda: ConsoleRenderer(unicode=True, color=False), "text/plain; charset=utf-8"),
+}
+
+
+@dataclass(slots=True)
+class ProfilerConfig:
+    '''
+    요청 profiling 설정
+
+        Attributes:
+            enabled (bool): profiling 사용 여부
+            sample_rate (float): profiling 결과를 저장할 요청 비율 (0 ~ 1)
+            slow_ms (float): 처리 시간이 이 값 이상인 요청의 profiling 결과 저장 (ms, 0이면 사용하지 않음)
+    '''
+    enabled: bool
+    sample_rate: float
+    slow_ms: float
+
+
+@dataclass(slots=True)
+class RequestProfile:
+    '''
+    요청 하나의 profiling 결과
+
+        Attributes:
+            id (int): worker 내 profiling 결과 ID
+            started_at (float): 요청 시작 시각 (unix time)
+            method (str): HTTP method
+            route (str): route template
+            path (str): 요청 경로
+            status (int): 응답 상태 코드
+            duration_ms (float): 요청 처리 시간 (ms)
+            reason (str): 저장 사유 (sampled, slow)
+            sql_count (int): 실행된 SQL 수
+            sql_ms (float): SQL 실행 시간 합계 (ms)
+            statements (list): 실행 시간이 가장 긴 SQL 목록
+            session: pyinstrument 실행 결과
+    '''
+    id: int
+    started_at: float
+    method: str
+    route: str
+    path: str
+    status: int
+    duration_ms: float
+    reason: str
+    sql_count: int
+    sql_ms: float
+    statements: list
+    session: object
+
+    def summary(self):
+        return {
+            "id": self.id,
+            "started_at": self.started_at,
+            "method": self.method,
+            "route": self.route,
+            "path": self.path,
+            "status": self.status,
+            "duration_ms": self.duration_ms,
+            "reason": self.reason,
+            "sql_count": self.sql_count,
+            "sql_ms": self.sql_ms,
+            "statements": self.statements,
+        }
+
+
+_settings = get_settings()
+_config = ProfilerConfig(
+    enabled=_settings.PROFILE_ENABLED,
+    sample_rate=_settings.PROFILE_SAMPLE_RATE,
+    slow_ms=_settings.PROFILE_SLOW_MS,
+)
+_profiles: deque[RequestProfile] = deque(maxlen=_settings.PROFILE_BUFFER_SIZE)
+_profile_ids = itertools.count(1)
+
+
+def get_profiler_config():
+    '''
+    현재 worker의 profiling 설정 조회 함수
+    '''
+    return asdict(_config)
+
+
+def set_profiler_config(enabled: bool, sample_rate: float, slow_ms: float):
+    '''
+    현재 worker의 profiling 설정 변경 함수
+
+    다음 요청부터 바로 적용되며 이미 profiling 중인 요청에는 영향을 주지 않음
+    '''
+    global _config
+    _config = ProfilerConfig(enabled=enabled, sample_rate=sample_rate, slow_ms=slow_ms)
+
+
+async def publish_profiler_config(rd: Redis):
+    '''
+    profiling 설정 전파 함수
+
+    현재 worker의 설정을 redis에 저장하고 pub/sub으로 다른 worker에도 적용
+    새로 시작하는 worker는 저장된 설정을 읽어 환경 변수 설정 대신 사용
+    '''
+    payload = json.dumps(asdict(_config))
+    pipe = rd.pipeline(transaction=False)
+    pipe.set(PROFILER_CONFIG_KEY, payload)
+    pipe.publish(PROFILER_CONFIG_CHANNEL, payload)
+    await pipe.execute()
+
+
+def _apply_payload(payload):
+    try:
+        config = json.loads(payload)
+        set_profiler_config(bool(config["enabled"]), float(config["sample_rate"]), float(config["slow_ms"]))
+    except (ValueError, KeyError, TypeError):
+        logger.warning("잘못된 profiling 설정을 무시합니다: %r", payload)
+
+
+async def listen_profiler_config(rd: Redis):
+    '''
+    profiling 설정 구독 함수
+
+    다른 worker에서 변경한 profiling 설정을 현재 worker에 적용,
+    구독이 끊긴 동안 누락된 변경이 있을 수 있으므로 재구독 시 저장된 설정을 다시 읽음
+    '''
+    while True:
+        pubsub = rd.pubsub()
+        try:
+            await pubsub.subscribe(PROFILER_CONFIG_CHANNEL)
+            payload = await rd.get(PROFILER_CONFIG_KEY)
+            if payload:
+                _apply_payload(payload)
+            while True:
+                message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                if message:
+                    _apply_payload(message["data"])
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.warning("profiling 설정 구독이 끊어졌습니다. 다시 연결합니다.", exc_info=True)
+            await asyncio.sleep(1)
+        finally:
+            await pubsub.reset()
+
+
+def list_profiles():
+    '''
+    현재 worker에 보관된 profiling 결과 목록 조회 함수 (최신순)
+    '''
+    return [profile.summary() for profile in reversed(_profiles)]
+
+
+def get_profile(profile_id: int):
+    '''
+    profiling 결과 조회 함수, 없으면 None
+    '''
+    for profile in _profiles:
+        if profile.id == profile_id:
+            return profile
+    return None
+
+
+def render_profile(profile: RequestProfile, fmt: str):
+    '''
+    profiling 결과 출력 함수
+
+        Arguments:
+            profile (RequestProfile): profiling 결과
+            fmt (str): 출력 형식 (speedscope, html, text)
+
+        Returns:
+            출력 문자열, content type
+    '''
+    make_renderer, media_type = RENDERERS[fmt]
+    return make_renderer().render(profile.session), media_type
+
+
+class ProfilingMiddleware:
+    '''
+    요청 profiling ASGI middleware
+
+    sampling profiler(pyinstrument)로 요청을 profiling 하여
+    sample_rate 비율로 뽑힌 요청과 slow_ms 이상 걸린 요청의 결과를 worker별 ring buffer에 보관
+    느린 요청을 잡기 위해 slow_ms를 사용하면 profiling이 켜진 동안 모든 요청을 profiling 하므로
+    평소에는 끄고 필요할 때만 /monitor/profiler로 켜서 사용
+
+    MetricsMiddleware 안쪽에 추가해야 요청별 SQL 실행 기록을 함께 저장함
+    '''
+    def __init__(self, app):
+        self.app = app
+        self.interval = _settings.PROFILE_INTERVAL_MS / 1000
+
+    async def __call__(self, scope, receive, send):
+        config = _config
+        if scope["type"] != "http" or not config.enabled:
+            await self.app(scope, receive, send)
+            return
+        sampled = random.random() < config.sample_rate
+        if not sampled and config.slow_ms <= 0:
+            await self.app(scope, receive, send)
+            return
+
+        stats = current_request_stats()
+        if stats is not None:
+            stats.statements = []
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        started_at = time.time()
+        started = time.perf_counter()
+        profiler = Profiler(interval=self.interval, async_mode="enabled")
+        profiler.start()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            session = profiler.stop()
+            duration_ms = (time.perf_counter() - started) * 1000
+            slow = 0 < config.slow_ms <= duration_ms
+            if sampled or slow:
+                statements = stats.statements if stats is not None else []
+                statements = sorted(statements, key=lambda item: item[0], reverse=True)[:PROFILE_TOP_STATEMENTS]
+                _profiles.append(RequestProfile(
+                    id=next(_profile_ids),
+                    started_at=started_at,
+                    method=scope["method"],
+                    route=getattr(scope.get("route"), "path", "unmatched"),
+                    path=scope["path"],
+                    status=status_code,
+                    duration_ms=round(duration_ms, 3),
+                    reason="slow" if slow else "sampled",
+                    sql_count=stats.sql_count if stats is not None else 0,
+                    sql_ms=round(stats.sql_seconds * 1000, 3) if stats is not None else 0.0,
+                    statements=[{"ms": round(elapsed * 1000, 3), "sql": sql} for elapsed, sql in statements],
+                    session=session,
+                ))
+            if stats is not None:
+                stats.statements = None
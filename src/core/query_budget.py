@@ -0,0 +1,130 @@
+import logging
+from dataclasses import dataclass
+
+from src.core.metrics import Counter, current_request_stats
+from src.utils.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+budget_exceeded = Counter("query_budget_exceeded_total", "route별 SQL 실행 수 제한 초과 횟수", ("route",))
+repeated_statements = Counter("query_repeated_statements_total", "route별 같은 SQL 반복 실행(N+1 의심) 감지 횟수", ("route",))
+
+
+class QueryBudgetExceeded(Exception):
+    '''
+    SQL 실행 수 제한 초과 예외 (QUERY_BUDGET_MODE=raise)
+    '''
+
+
+@dataclass(frozen=True, slots=True)
+class QueryBudget:
+    '''
+    route별 SQL 실행 수 제한
+
+        Attributes:
+            max_statements (int | None): 요청 하나에서 실행할 수 있는 최대 SQL 수 (None이면 제한 없음)
+            max_repeats (int | None): 같은 SQL 문장을 실행할 수 있는 최대 횟수, 초과 시 N+1로 판단 (None이면 검사하지 않음)
+    '''
+    max_statements: int | None
+    max_repeats: int | None = 1
+
+
+def query_budget(max_statements: int | None, max_repeats: int | None = 1):
+    '''
+    route SQL 실행 수 제한 선언 decorator
+
+    router decorator 아래에 사용하며, 캐시 미스 등 가장 많은 SQL이 실행되는 경우를 기준으로 선언
+
+        Arguments:
+            max_statements (int | None): 요청 하나에서 실행할 수 있는 최대 SQL 수
+            max_repeats (int | None): 같은 SQL 문장을 실행할 수 있는 최대 횟수
+
+        Returns:
+            endpoint 함수를 그대로 반환하는 decorator
+    '''
+    budget = QueryBudget(max_statements, max_repeats)
+
+    def decorator(endpoint):
+        endpoint.__query_budget__ = budget
+        return endpoint
+    return decorator
+
+
+def check_query_budget(route: str, budget: QueryBudget, sql_count: int, shapes: dict[str, int],
+                       response_started: bool = False):
+    '''
+    SQL 실행 수 제한 확인 함수
+
+    제한 초과, 같은 SQL 반복 실행을 metric으로 기록하고 QUERY_BUDGET_MODE에 따라 log를 남기거나 예외 발생
+
+        Arguments:
+            route (str): route template
+            budget (QueryBudget): route에 선언된 제한
+            sql_count (int): 요청에서 실행된 SQL 수
+            shapes (dict): SQL 문장별 실행 횟수
+            response_started (bool): 응답이 이미 시작되었는지 여부, 응답을 바꿀 수 없으므로 raise 대신 log
+
+        Raises:
+            QueryBudgetExceeded: QUERY_BUDGET_MODE가 raise이고 제한을 초과한 경우
+
+        Returns:
+            제한 초과 여부
+    '''
+    problems = []
+    if budget.max_statements is not None and sql_count > budget.max_statements:
+        budget_exceeded.inc(route)
+        problems.append(f"SQL {sql_count}회 실행 (제한 {budget.max_statements}회)")
+    if budget.max_repeats is not None:
+        repeated = [(count, statement) for statement, count in shapes.items() if count > budget.max_repeats]
+        if repeated:
+            repeated_statements.inc(route)
+            problems.extend(f"같은 SQL {count}회 반복 실행 (N+1 의심): {statement}" for count, statement in repeated)
+    if not problems:
+        return False
+    mode = get_settings().QUERY_BUDGET_MODE
+    message = f"{route}: " + "; ".join(problems)
+    if mode == "raise" and not response_started:
+        raise QueryBudgetExceeded(message)
+    if mode != "metric":
+        logger.warning(message)
+    return True
+
+
+class QueryBudgetMiddleware:
+    '''
+    route SQL 실행 수 제한 확인 ASGI middleware
+
+    응답을 시작하기 직전(http.response.start)에 route endpoint에 query_budget으로 선언된 제한과 실제 SQL 실행 수를 비교하므로
+    raise 모드에서는 제한 초과 요청이 500으로 응답됨
+    stream 응답처럼 응답을 보내는 중에 실행된 SQL은 응답이 끝난 뒤 다시 확인하며, 이때는 raise 모드에서도 log만 남김
+    MetricsMiddleware 안쪽에 추가해야 요청별 SQL 실행 기록을 사용할 수 있음
+    '''
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        stats = current_request_stats()
+        if scope["type"] != "http" or stats is None:
+            await self.app(scope, receive, send)
+            return
+
+        checked_count = None
+        exceeded = False
+
+        def check(response_started: bool):
+            route = scope.get("route")
+            budget = getattr(getattr(route, "endpoint", None), "__query_budget__", None)
+            if budget is None:
+                return False
+            return check_query_budget(route.path, budget, stats.sql_count, stats.shapes, response_started)
+
+        async def send_wrapper(message):
+            nonlocal checked_count, exceeded
+            if message["type"] == "http.response.start":
+                checked_count = stats.sql_count
+                exceeded = check(response_started=False)
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+        if checked_count is not None and not exceeded and stats.sql_count != checked_count:
+            check(response_started=True)
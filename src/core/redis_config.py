@@ -1,12 +1,66 @@
-import redis
+from redis import asyncio as aioredis
 
-from src.utils.config import Settings
+from src.core.metrics import InstrumentedRedis
+from src.utils.config import get_settings
 
+_pool: aioredis.BlockingConnectionPool | None = None
+_client: aioredis.Redis | None = None
 
-def get_redis():
+
+def init_redis():
+    '''
+    Redis connection pool 생성 함수
+
+    앱 실행 시 한 번 호출되어 모든 요청이 공유하는 connection pool과 client를 생성
+    client는 명령 수와 왕복 시간을 metric으로 기록
+    '''
+    global _pool, _client
+    settings = get_settings()
+    _pool = aioredis.BlockingConnectionPool(
+        host=settings.REDIS_HOST,
+        port=settings.REDIS_PORT,
+        db=settings.REDIS_DATABASE,
+        max_connections=settings.REDIS_MAX_CONNECTIONS,
+        timeout=settings.REDIS_POOL_TIMEOUT,
+        socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+        socket_connect_timeout=settings.REDIS_SOCKET_CONNECT_TIMEOUT,
+        health_check_interval=settings.REDIS_HEALTH_CHECK_INTERVAL,
+    )
+    _client = InstrumentedRedis(connection_pool=_pool)
+
+
+async def close_redis():
+    '''
+    Redis connection pool 종료 함수
+    '''
+    global _pool, _client
+    if _pool is not None:
+        await _pool.disconnect()
+    _pool, _client = None, None
+
+
+async def get_redis():
     '''
     Redis 연결 관리 함수
     '''
-    rd = redis.Redis(host=Settings().REDIS_HOST, port=Settings().REDIS_PORT, db=Settings().REDIS_DATABASE)
-    if rd: return rd
-    else: raise Exception("Redis가 연결되지 않았습니다.")
+    if _client is None:
+        raise Exception("Redis가 연결되지 않았습니다.")
+    return _client
+
+
+def get_redis_pool_stats():
+    '''
+    Redis connection pool 상태 조회 함수
+
+        Returns:
+            max_connections (int): pool 최대 연결 수
+            in_use (int): 사용 중인 연결 수
+            available (int): 대기 중인 유휴 연결 수
+    '''
+    if _pool is None:
+        return {"max_connections": 0, "in_use": 0, "available": 0}
+    return {
+        "max_connections": _pool.max_connections,
+        "in_use": len(_pool._in_use_connections),
+        "available": len(_pool._available_connections),
+    }
@@ -1,12 +1,27 @@
-from sqlalchemy.orm import Session
-from fastapi import APIRouter, Depends, HTTPException, status
-
-from src.utils.config import Settings
-from src.utils.db_utils import get_board_from_db
-from src.utils.validator import board_name_validator
-from src.utils.auth import get_current_user, auth_board_edit, auth_board_read
-from src.core.models import Board
+from typing import Literal
+
+from sqlalchemy import select, func, delete
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from redis.asyncio import Redis
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
+
+from src.utils.config import get_settings
+from src.utils.db_utils import get_board_from_db, insert_unique
+from src.utils.auth import get_current_user, auth_board_edit, auth_board_read, can_read_board
+from src.utils.batch import parse_ids
+from src.utils.pagination import encode_cursor, decode_cursor
+from src.utils.counters import discard_post_count, pending_post_count, discard_board_views
+from src.utils.board_rank import board_rank_page, rank_set, rank_remove
+from src.utils.cache import get_cached_board, get_versions, bump_versions
+from src.utils.etag import make_etag, etag_matches, not_modified
+from src.utils.export import export_posts
+from src.utils.feed import feed_set_public, feed_drop_board
+from src.core.models import Board, Post
 from src.core.db_config import get_db
+from src.core.redis_config import get_redis
+from src.core.query_budget import query_budget
 from src.domain.board import board_schema
 
 router = APIRouter(
@@ -15,17 +30,21 @@ router = APIRouter(
 
 
 @router.post("/create")
-def board_create(created_board: board_schema.Board,
-                 db: Session = Depends(get_db),
-                 curr_user_id: int = Depends(get_current_user)):
+@query_budget(1)
+async def board_create(created_board: board_schema.Board,
+                       db: AsyncSession = Depends(get_db),
+                       rd: Redis = Depends(get_redis),
+                       curr_user_id: int = Depends(get_current_user)):
     '''
     게시판 생성 함수
 
     새로운 board 객체를 생성하고 DB에 저장
+    이름 중복은 별도로 조회하지 않고 INSERT 한 번으로 DB의 unique 제약 충돌 여부를 확인
 
         Arguments:
             created_board (Board): 게시판 Schema
-            db (Session): DB 세션
+            db (AsyncSession): DB 세션
+            rd (Redis): Redis 연결
 
         Raises:
             HTTP_400_BAD_REQUEST: 이미 존재하는 이름으로 게시판을 생성하려는 경우
@@ -33,65 +52,86 @@ def board_create(created_board: board_schema.Board,
         Returns:
             board 생성 완료 메시지
     '''
-    board_name_validator(created_board.name, db)
-    _board = Board(
-        name = created_board.name,
-        public = created_board.public,
-        user_id = curr_user_id
-    )
-    try:
-        db.add(_board)
-        db.commit()
-    except:
+    board_id = await insert_unique(Board, {
+        "name": created_board.name,
+        "public": created_board.public,
+        "user_id": curr_user_id
+    }, Board.name, db)
+    if board_id is None:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="같은 이름의 게시판이 이미 존재합니다.")
+    await db.commit()
+    await rd.delete(f"board_count:{curr_user_id}")
+    await bump_versions(rd, ("board_list", 0))
+    if created_board.public:
+        await rank_set(rd, board_id, 0)
     return {'msg': '게시판 생성이 완료되었습니다.'}
 
 
 @router.patch("/update/{board_id}")
-def board_update(board_id: int,
-                 updated_board: board_schema.Board,
-                 db: Session = Depends(get_db),
-                 curr_user_id: int = Depends(get_current_user)):
+@query_budget(2)
+async def board_update(board_id: int,
+                       updated_board: board_schema.Board,
+                       db: AsyncSession = Depends(get_db),
+                       rd: Redis = Depends(get_redis),
+                       curr_user_id: int = Depends(get_current_user)):
     '''
     게시판 수정 함수
 
     입력받은 id가 일치하는 게시판의 name과 public을 수정하고 DB 저장
+    이름 중복은 별도로 조회하지 않고 UPDATE 시 DB의 unique 제약 위반으로 확인
 
         Arguments:
             board_id (int): 수정하려는 게시판 ID
             updated_board (Board): 게시판 Schema
-            db (Session): DB 세션
+            db (AsyncSession): DB 세션
+            rd (Redis): Redis 연결
             curr_user_id (int): 현재 로그인된 유저 ID
 
         Raises:
-            HTTP_400_BAD_REQUEST: 해당하는 게시판이 존재하지 않는 경우
+            HTTP_400_BAD_REQUEST: 이미 존재하는 이름으로 게시판을 수정하려는 경우
             HTTP_401_UNAUTHORIZED: 해당 게시판의 수정 권한이 없는 경우
-            HTTP_404_NOT_FOUND: 이미 존재하는 이름으로 게시판을 수정하려는 경우
+            HTTP_404_NOT_FOUND: 해당하는 게시판이 존재하지 않는 경우
 
         Returns:
             게시판 수정 완료 메시지
     '''
-    _board = get_board_from_db(board_id, db)
+    _board = await get_board_from_db(board_id, db)
     auth_board_edit(_board, curr_user_id)
-    board_name_validator(updated_board.name, db)
+    was_public = _board.public
     _board.name = updated_board.name
     _board.public = updated_board.public
-    db.commit()
+    try:
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="같은 이름의 게시판이 이미 존재합니다.")
+    await rd.delete(f"board_count:{curr_user_id}")
+    await bump_versions(rd, ("board", board_id), ("board_list", 0))
+    if _board.public:
+        await rank_set(rd, board_id, _board.post_count + await pending_post_count(rd, board_id))
+    else:
+        await rank_remove(rd, board_id)
+    if _board.public != was_public:
+        await feed_set_public(rd, board_id, _board.public)
     return {'msg': '게시판 수정이 완료되었습니다.'}
 
 
 @router.delete("/delete/{board_id}")
-def board_delete(board_id: int,
-                 db: Session = Depends(get_db),
-                 curr_user_id: int = Depends(get_current_user)):
+@query_budget(3)
+async def board_delete(board_id: int,
+                       db: AsyncSession = Depends(get_db),
+                       rd: Redis = Depends(get_redis),
+                       curr_user_id: int = Depends(get_current_user)):
     '''
     게시판 삭제 함수
 
     게시판 id를 입력받아 해당 게시판을 DB에서 삭제
+    게시판의 게시글은 하나씩 불러오지 않고 DELETE 한 번으로 함께 삭제
 
         Arguments:
             board_id (int): 삭제할 게시판의 ID
-            db (Session): DB 세션
+            db (AsyncSession): DB 세션
+            rd (Redis): Redis 연결
             curr_user_id (int): 현재 로그인된 유저 ID
 
         Raises:
@@ -101,26 +141,42 @@ def board_delete(board_id: int,
         Returns:
             게시판 삭제 완료 메시지
     '''
-    _board = get_board_from_db(board_id, db)
+    _board = await get_board_from_db(board_id, db)
     auth_board_edit(_board, curr_user_id)
-    db.delete(_board)
-    db.commit()
+    await db.execute(delete(Post).where(Post.board_id == board_id))
+    await db.delete(_board)
+    await db.commit()
+    await rd.delete(f"board_count:{curr_user_id}")
+    await bump_versions(rd, ("board", board_id), ("board_list", 0))
+    await discard_post_count(rd, board_id)
+    await rank_remove(rd, board_id)
+    await feed_drop_board(rd, board_id)
+    await discard_board_views(rd, board_id)
     return {'msg':'삭제되었습니다.'}
 
 
-@router.get("/get/{board_id}")
-def board_detail(board_id : int,
-                 db: Session = Depends(get_db),
-                 curr_user_id: int = Depends(get_current_user)):
+@router.get("/get/{board_id}", response_model=board_schema.BoardOut)
+@query_budget(1)
+async def board_detail(board_id : int,
+                       response: Response,
+                       db: AsyncSession = Depends(get_db),
+                       rd: Redis = Depends(get_redis),
+                       curr_user_id: int = Depends(get_current_user),
+                       if_none_match: str | None = Header(None)):
     '''
     게시판 상세 조회 함수
 
     게시판 ID를 입력받아 해당 게시판을 조회
+    게시판 정보는 redis 캐시에서 조회하고, 캐시가 없거나 수정된 경우에만 DB에서 조회
+    게시판 version으로 ETag를 생성하여 If-None-Match와 일치하면 304 반환
 
         Arguments:
             board_id (int): 조회할 게시판의 ID
-            db (Session): DB 세션
+            response (Response): ETag header를 설정할 응답
+            db (AsyncSession): DB 세션
+            rd (Redis): Redis 연결
             curr_user_id (int): 현재 로그인된 유저 ID
+            if_none_match (str): 클라이언트가 가진 ETag
 
         Raises:
             HTTP_401_UNAUTHORIZED: 해당 게시판의 조회 권한이 없는 경우
@@ -129,35 +185,216 @@ def board_detail(board_id : int,
         Returns:
             조회하는 게시판 객체
     '''
-    _board = get_board_from_db(board_id, db)
+    _board, board_version = await get_cached_board(board_id, rd)
     auth_board_read(_board, curr_user_id)
+    etag = make_etag("board", board_id, board_version)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
     return _board
 
 
-@router.get("/list/{page}")
-def board_list(db: Session = Depends(get_db),
-               curr_user_id: int = Depends(get_current_user),
-               page: int = 0):
+@router.get("/batch", response_model=board_schema.BoardBatch)
+@query_budget(1)
+async def board_batch(ids: str,
+                      db: AsyncSession = Depends(get_db),
+                      curr_user_id: int = Depends(get_current_user)):
+    '''
+    게시판 일괄 조회 함수
+
+    쉼표로 구분된 여러 게시판 ID를 하나의 IN 쿼리로 조회하고, 게시판별 접근 권한을 한 번에 확인
+
+        Arguments:
+            ids (str): 쉼표로 구분된 게시판 ID 목록 (최대 BATCH_MAX_IDS개)
+            db (AsyncSession): DB 세션
+            curr_user_id (int): 현재 로그인된 유저 ID
+
+        Raises:
+            HTTP_400_BAD_REQUEST: ID 목록 형식이 올바르지 않거나 최대 개수를 초과한 경우
+
+        Returns:
+            found (list): 조회된 게시판 목록
+            forbidden (list): 접근 권한이 없는 게시판 ID 목록
+            missing (list): 존재하지 않는 게시판 ID 목록
+    '''
+    board_ids = parse_ids(ids)
+    boards = {board.id: board for board in await db.scalars(select(Board).where(Board.id.in_(board_ids)))}
+    found, forbidden, missing = [], [], []
+    for board_id in board_ids:
+        _board = boards.get(board_id)
+        if _board is None:
+            missing.append(board_id)
+        elif can_read_board(_board, curr_user_id):
+            found.append(_board)
+        else:
+            forbidden.append(board_id)
+    return {"found": found, "forbidden": forbidden, "missing": missing}
+
+
+def _board_visible(user_id: int):
+    '''
+    조회 가능한 게시판 조건 (본인이 생성했거나 공개된 게시판)
+    '''
+    return (Board.user_id == user_id) | (Board.public)
+
+
+async def _board_count(user_id: int, db: AsyncSession, rd: Redis):
+    '''
+    접근 가능한 게시판 수 조회 함수
+
+    redis에 캐시된 게시판 수를 반환하고, 캐시가 없는 경우 DB에서 count 후 BOARD_COUNT_CACHE_SECONDS 동안 캐시
+
+        Arguments:
+            user_id (int): 현재 로그인된 유저 ID
+            db (AsyncSession): DB 세션
+            rd (Redis): Redis 연결
+
+        Returns:
+            접근 가능한 게시판 수
+    '''
+    key = f"board_count:{user_id}"
+    total = await rd.get(key)
+    if total is None:
+        total = await db.scalar(select(func.count()).select_from(Board).filter(_board_visible(user_id)))
+        await rd.set(key, total, ex=get_settings().BOARD_COUNT_CACHE_SECONDS)
+    return int(total)
+
+
+@router.get("/list", response_model=board_schema.BoardCursorList)
+@query_budget(2)
+async def board_list_cursor(response: Response,
+                            db: AsyncSession = Depends(get_db),
+                            rd: Redis = Depends(get_redis),
+                            curr_user_id: int = Depends(get_current_user),
+                            cursor: str | None = None,
+                            if_none_match: str | None = Header(None)):
+    '''
+    게시판 목록 cursor 조회 함수
+
+    접근 권한이 있는 게시판 목록을 (post_count, id) 역순으로 cursor 이후부터 조회 (keyset pagination)
+    게시판 목록 version과 게시판 수로 ETag를 생성하여 If-None-Match와 일치하면 게시판을 조회하지 않고 304 반환
+    게시판 수는 유저별로 일정 시간 캐시되어 다른 유저의 게시판 생성/삭제가 version과 별도로 반영되므로 ETag에 포함
+
+        Arguments:
+            response (Response): ETag header를 설정할 응답
+            db (AsyncSession): DB 세션
+            rd (Redis): Redis 연결
+            curr_user_id (int): 현재 로그인된 유저 ID
+            cursor (str): 이전 응답의 next_cursor, 첫 페이지는 생략
+            if_none_match (str): 클라이언트가 가진 ETag
+
+        Raises:
+            HTTP_400_BAD_REQUEST: cursor 형식이 올바르지 않은 경우
+
+        Returns:
+            board_count (int): 접근 가능한 전체 게시판 수
+            board_list (list): cursor 이후의 게시판 목록
+            next_cursor (str): 다음 페이지 cursor, 마지막 페이지인 경우 None
+    '''
+    size = get_settings().PAGE_SIZE
+    list_version, = await get_versions(rd, ("board_list", 0))
+    board_count = await _board_count(curr_user_id, db, rd)
+    etag = make_etag("board_list_cursor", curr_user_id, cursor, size, list_version, board_count)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
+
+    _query = select(Board).filter(_board_visible(curr_user_id))
+    if cursor:
+        last_count, last_id = decode_cursor(cursor, int, int)
+        _query = _query.filter((Board.post_count < last_count) |
+                               ((Board.post_count == last_count) & (Board.id < last_id)))
+    _board_list = (await db.scalars(_query.order_by(Board.post_count.desc(), Board.id.desc()).limit(size + 1))).all()
+    next_cursor = None
+    if len(_board_list) > size:
+        next_cursor = encode_cursor(_board_list[size - 1].post_count, _board_list[size - 1].id)
+
+    return {
+        "board_count": board_count,
+        "board_list": _board_list[:size],
+        "next_cursor": next_cursor
+    }
+
+
+@router.get("/list/{page}", response_model=board_schema.BoardList)
+@query_budget(2)
+async def board_list(response: Response,
+                     db: AsyncSession = Depends(get_db),
+                     rd: Redis = Depends(get_redis),
+                     curr_user_id: int = Depends(get_current_user),
+                     page: int = 0,
+                     if_none_match: str | None = Header(None)):
     '''
     게시판 목록 조회 함수
 
-    접근 권한이 있는 전체 게시판 목록을 조회
+    접근 권한이 있는 전체 게시판 목록을 게시글 수 순서로 조회
+    공개 게시판 순위는 redis ZSET에서 조회하고, 현재 유저의 비공개 게시판만 DB에서 조회하여 병합
+    게시판 목록 version으로 ETag를 생성하여 If-None-Match와 일치하면 게시판을 조회하지 않고 304 반환
 
         Arguments:
-            db (Session): DB 세션
+            response (Response): ETag header를 설정할 응답
+            db (AsyncSession): DB 세션
+            rd (Redis): Redis 연결
             curr_user_id (int): 현재 로그인된 유저 ID
             page (int): 조회하려는 게시판 목록의 페이지
+            if_none_match (str): 클라이언트가 가진 ETag
 
         Returns:
             전체 게시판 목록의 해당 페이지
     '''
-    size = Settings().PAGE_SIZE
+    size = get_settings().PAGE_SIZE
+    list_version, = await get_versions(rd, ("board_list", 0))
+    etag = make_etag("board_list", curr_user_id, page, size, list_version)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
 
-    _board_list = db.query(Board).filter((Board.user_id == curr_user_id) | (Board.public)).order_by(Board.post_count.desc())
-    total = _board_list.count()
-    board_list_paged = _board_list.offset(page*size).limit(size).all()
+    total, board_list_paged = await board_rank_page(rd, db, curr_user_id, page, size)
 
     return {
         "board_count": total,
         "board_list": board_list_paged
-    }
\ No newline at end of file
+    }
+
+
+@router.get("/export/{board_id}")
+@query_budget(2)
+async def board_export(board_id: int,
+                       db: AsyncSession = Depends(get_db),
+                       curr_user_id: int = Depends(get_current_user),
+                       export_format: Literal["ndjson", "csv"] = Query("ndjson", alias="format"),
+                       gzip: bool = False):
+    '''
+    게시판 게시글 export 함수
+
+    게시판의 모든 게시글을 NDJSON 또는 CSV 파일로 stream 응답
+    server-side cursor로 일정 개수씩 조회하여 바로 전송하므로 게시판 크기와 관계없이 메모리 사용량이 일정함
+    stream 하는 동안에는 export용 세션의 연결 하나만 사용
+
+        Arguments:
+            board_id (int): export할 게시판 ID
+            db (AsyncSession): DB 세션
+            curr_user_id (int): 현재 로그인된 유저 ID
+            export_format (str): 파일 형식 (ndjson, csv), query parameter 이름은 format
+            gzip (bool): gzip 압축 여부
+
+        Raises:
+            HTTP_401_UNAUTHORIZED: 해당 게시판의 조회 권한이 없는 경우
+            HTTP_404_NOT_FOUND: 입력한 id와 일치하는 게시판이 없는 경우
+
+        Returns:
+            게시글 파일 stream
+    '''
+    _board = await get_board_from_db(board_id, db)
+    auth_board_read(_board, curr_user_id)
+    # 요청 세션은 stream이 끝난 뒤에 종료되므로, 별도 세션으로 stream 하는 동안 연결을 점유하지 않도록 미리 반환
+    await db.commit()
+    filename = f"board_{board_id}.{export_format}"
+    media_type = "text/csv" if export_format == "csv" else "application/x-ndjson"
+    if gzip:
+        filename += ".gz"
+        media_type = "application/gzip"
+    return StreamingResponse(export_posts(board_id, export_format, gzip),
+                             media_type=media_type,
+                             headers={"Content-Disposition": f'attachment; filename="{filename}"'})
+
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, validator
+from pydantic import BaseModel, ConfigDict, validator
 from fastapi import status, HTTPException
 
 
@@ -25,4 +25,61 @@ class Board(BaseModel):
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="빈 칸을 모두 채워주세요")
         if type(v) == bool and v == None:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="빈 칸을 모두 채워주세요")
-        return v
\ No newline at end of file
+        return v
+
+
+class BoardOut(BaseModel):
+    '''
+    게시판 조회 응답 Schema
+
+        Attributes:
+            id (int): 게시판 ID
+            name (str): 게시판 이름
+            public (bool): 게시판 공개 여부 Flag
+            user_id (int): 게시판을 생성한 유저 ID
+            post_count (int): 게시판의 게시글 수
+    '''
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    name: str
+    public: bool
+    user_id: int
+    post_count: int
+
+
+class BoardList(BaseModel):
+    '''
+    게시판 목록 조회 응답 Schema
+
+        Attributes:
+            board_count (int): 접근 가능한 전체 게시판 수
+            board_list (list[BoardOut]): 해당 페이지의 게시판 목록
+    '''
+    board_count: int
+    board_list: list[BoardOut]
+
+
+class BoardCursorList(BoardList):
+    '''
+    게시판 목록 cursor 조회 응답 Schema
+
+        Attributes:
+            next_cursor (str): 다음 페이지 cursor, 마지막 페이지인 경우 None
+    '''
+    next_cursor: str | None
+
+
+class BoardBatch(BaseModel):
+    '''
+    게시판 일괄 조회 응답 Schema
+
+        Attributes:
+            found (list[BoardOut]): 조회된 게시판 목록 (요청 순서)
+            forbidden (list[int]): 접근 권한이 없는 게시판 ID 목록
+            missing (list[int]): 존재하지 않는 게시판 ID 목록
+    '''
+    found: list[BoardOut]
+    forbidden: list[int]
+    missing: list[int]
+
@@ -0,0 +1,169 @@
+from typing import Literal
+
+from fastapi import APIRouter, Depends, status, HTTPException
+from fastapi.responses import PlainTextResponse, Response
+from redis.asyncio import Redis
+
+from src.core.metrics import render_metrics
+from src.core.db_config import get_db_pool_stats
+from src.core.profiling import (get_profiler_config, set_profiler_config, publish_profiler_config,
+                                list_profiles, get_profile, render_profile)
+from src.core.query_budget import query_budget
+from src.core.redis_config import get_redis_pool_stats, get_redis
+from src.domain.monitor.monitor_schema import ProfilerConfig
+from src.utils.auth import auth_monitor
+from src.utils.password import get_password_pool_stats
+from src.utils.single_flight import single_flight
+from src.utils.token_cache import token_cache
+
+# 운영 정보를 노출하므로 모든 /monitor endpoint는 X-Monitor-Token header 필요 (MONITOR_TOKEN이 비어 있으면 사용 불가)
+router = APIRouter(
+    prefix="/monitor",
+    dependencies=[Depends(auth_monitor)]
+)
+
+metrics_router = APIRouter()
+
+
+@metrics_router.get("/metrics", response_class=PlainTextResponse)
+@query_budget(0)
+async def metrics():
+    '''
+    Prometheus metric 조회 함수
+
+    현재 worker의 HTTP 요청, SQL, redis metric을 Prometheus text 형식으로 반환
+
+        Returns:
+            Prometheus text exposition 형식 문자열
+    '''
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4")
+
+
+@router.get("/pool")
+@query_budget(0)
+async def pool_stats():
+    '''
+    connection pool 상태 조회 함수
+
+    pool 크기 조정을 위해 현재 connection pool의 사용 현황을 반환
+
+        Returns:
+            db (dict): DB connection pool 상태
+            redis (dict): Redis connection pool 상태
+            password (dict): 비밀번호 hash process pool 대기 현황
+    '''
+    return {
+        "db": get_db_pool_stats(),
+        "redis": get_redis_pool_stats(),
+        "password": get_password_pool_stats()
+    }
+
+
+@router.get("/token-cache")
+@query_budget(0)
+async def token_cache_stats():
+    '''
+    access token 캐시 상태 조회 함수
+
+    현재 worker의 access token 캐시 크기와 적중률을 반환
+
+        Returns:
+            size (int): 캐시된 token 수
+            maxsize (int): 캐시 최대 크기
+            hits (int): 캐시 적중 횟수
+            misses (int): 캐시 미스 횟수
+            hit_ratio (float): 캐시 적중률
+    '''
+    return token_cache.stats()
+
+
+@router.get("/single-flight")
+@query_budget(0)
+async def single_flight_stats():
+    '''
+    동일 요청 병합 상태 조회 함수
+
+    현재 worker에서 동시에 발생한 같은 조회가 하나의 쿼리로 병합된 비율을 반환
+
+        Returns:
+            calls (int): 전체 조회 수
+            shared (int): 다른 조회의 결과를 공유한 조회 수
+            coalescing_ratio (float): 병합 비율
+    '''
+    return single_flight.stats()
+
+
+@router.get("/profiler")
+@query_budget(0)
+async def profiler_config():
+    '''
+    요청 profiling 설정 조회 함수
+
+    현재 worker에 적용된 profiling 설정을 반환
+
+        Returns:
+            enabled (bool): profiling 사용 여부
+            sample_rate (float): profiling 결과를 저장할 요청 비율
+            slow_ms (float): profiling 결과를 저장할 최소 처리 시간 (ms)
+    '''
+    return get_profiler_config()
+
+
+@router.put("/profiler")
+@query_budget(0)
+async def update_profiler_config(config: ProfilerConfig, rd: Redis = Depends(get_redis)):
+    '''
+    요청 profiling 설정 변경 함수
+
+    재시작 없이 profiling 설정을 변경하고 redis pub/sub으로 모든 worker에 전파
+
+        Arguments:
+            config (ProfilerConfig): 변경할 profiling 설정
+            rd (Redis): Redis 연결
+
+        Returns:
+            변경된 profiling 설정
+    '''
+    set_profiler_config(config.enabled, config.sample_rate, config.slow_ms)
+    await publish_profiler_config(rd)
+    return get_profiler_config()
+
+
+@router.get("/profiles")
+@query_budget(0)
+async def profiles():
+    '''
+    profiling 결과 목록 조회 함수
+
+    현재 worker에 보관된 profiling 결과의 요청 정보와 실행 시간이 긴 SQL 목록을 최신순으로 반환
+
+        Returns:
+            profiling 결과 목록
+    '''
+    return list_profiles()
+
+
+@router.get("/profiles/{profile_id}")
+@query_budget(0)
+async def download_profile(profile_id: int, format: Literal["speedscope", "html", "text"] = "speedscope"):
+    '''
+    profiling 결과 다운로드 함수
+
+    profiling 결과를 flamegraph 형식으로 반환
+    speedscope 형식은 https://www.speedscope.app 에서 열 수 있음
+
+        Arguments:
+            profile_id (int): profiling 결과 ID
+            format (str): 출력 형식 (speedscope, html, text)
+
+        Raises:
+            HTTP_404_NOT_FOUND: profiling 결과가 현재 worker에 없는 경우
+
+        Returns:
+            profiling 결과
+    '''
+    profile = get_profile(profile_id)
+    if profile is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="존재하지 않는 profiling 결과입니다.")
+    body, media_type = render_profile(profile, format)
+    return Response(body, media_type=media_type)
@@ -0,0 +1,37 @@
+from pydantic import BaseModel, validator
+from fastapi import status, HTTPException
+
+
+class ProfilerConfig(BaseModel):
+    '''
+    요청 profiling 설정 입력 Schema
+
+        Attributes:
+            enabled (bool): profiling 사용 여부
+            sample_rate (float): profiling 결과를 저장할 요청 비율 (0 ~ 1)
+            slow_ms (float): 처리 시간이 이 값 이상인 요청의 profiling 결과 저장 (ms, 0이면 사용하지 않음)
+
+        Raises:
+            HTTP_400_BAD_REQUEST: sample_rate가 0 ~ 1 범위를 벗어나거나 slow_ms가 음수인 경우
+    '''
+    enabled: bool
+    sample_rate: float = 0.0
+    slow_ms: float = 0.0
+
+    @validator('sample_rate')
+    def check_sample_rate(cls, v):
+        '''
+        sample_rate가 0 ~ 1 범위인지 체크
+        '''
+        if not 0 <= v <= 1:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="sample_rate는 0 이상 1 이하로 입력해주세요.")
+        return v
+
+    @validator('slow_ms')
+    def check_slow_ms(cls, v):
+        '''
+        slow_ms가 음수가 아닌지 체크
+        '''
+        if v < 0:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="slow_ms는 0 이상으로 입력해주세요.")
+        return v
@@ -1,11 +1,27 @@
-from fastapi import APIRouter, Depends, status, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Header, Path, Query, Request, Response, status, HTTPException
+from sqlalchemy import select
+from sqlalchemy.orm import undefer
+from sqlalchemy.ext.asyncio import AsyncSession
+from redis.asyncio import Redis
 
-from src.utils.config import Settings
+from src.utils.config import get_settings
 from src.utils.db_utils import get_post_from_db, get_board_from_db
-from src.utils.auth import get_current_user, auth_post_edit, auth_board_read
-from src.core.db_config import get_db
-from src.core.models import Post, Board
+from src.utils.auth import get_current_user, auth_post_edit, auth_board_read, can_read_board
+from src.utils.batch import parse_ids
+from src.utils.pagination import encode_cursor, decode_cursor
+from src.utils.counters import incr_post_count, pending_post_count, record_view, discard_views, most_viewed
+from src.utils.board_rank import rank_incr
+from src.utils.cache import get_cached_board, get_cached_post, get_versions, bump_versions
+from src.utils.etag import make_etag, etag_matches, not_modified
+from src.utils.single_flight import single_flight
+from src.utils.excerpt import make_excerpt
+from src.utils.search import search_posts
+from src.utils.post_import import iter_lines, import_posts
+from src.utils.feed import feed_add, feed_remove, feed_page
+from src.core.db_config import SessionLocal, get_db
+from src.core.redis_config import get_redis
+from src.core.query_budget import query_budget
+from src.core.models import Board, Post
 from src.domain.post import post_schema
 
 router = APIRouter(
@@ -14,19 +30,23 @@ router = APIRouter(
 
 
 @router.post("/create/{board_id}")
-def post_create(board_id: int,
-                created_post: post_schema.Post,
-                db: Session = Depends(get_db),
-                curr_user_id: int = Depends(get_current_user)):
+@query_budget(2)
+async def post_create(board_id: int,
+                      created_post: post_schema.Post,
+                      db: AsyncSession = Depends(get_db),
+                      rd: Redis = Depends(get_redis),
+                      curr_user_id: int = Depends(get_current_user)):
     '''
     게시글 생성 함수
 
-    새로운 post 객체를 생성하고 DB에 저장, board 객체에 게시글 counting
+    새로운 post 객체를 생성하고 DB에 저장, 게시판의 게시글 수 변경량을 redis에 누적
+    목록 조회용 게시글 요약(excerpt)을 함께 저장
 
         Arguements:
             board_id (int): 게시글을 작성할 게시판 ID
             created_post (Post): 게시글 입력 Schema
-            db (Session): DB 세션
+            db (AsyncSession): DB 세션
+            rd (Redis): Redis 연결
             curr_user_id (int): 현재 로그인된 유저 ID
 
         Raises:
@@ -36,34 +56,75 @@ def post_create(board_id: int,
         Returns:
             게시글 생성 완료 메시지
     '''
-    _board = get_board_from_db(board_id, db)
+    _board = await get_board_from_db(board_id, db)
     auth_board_read(_board, curr_user_id)
     _post = Post(
         board_id = board_id,
         title = created_post.title,
         content = created_post.content,
+        excerpt = make_excerpt(created_post.content),
         user_id = curr_user_id
     )
     db.add(_post)
-    _board.post_count += 1
-    db.commit()
+    await db.commit()
+    await incr_post_count(rd, board_id, 1)
+    await rank_incr(rd, board_id, 1)
+    await feed_add(rd, board_id, _board.public, _post.id)
+    await bump_versions(rd, ("board_posts", board_id), ("board_list", 0))
     return {'msg': '게시글이 생성되었습니다.'}
 
 
+@router.post("/import/{board_id}", response_model=post_schema.PostImportResult)
+@query_budget(None, max_repeats=None)
+async def post_import(board_id: int,
+                      request: Request,
+                      db: AsyncSession = Depends(get_db),
+                      rd: Redis = Depends(get_redis),
+                      curr_user_id: int = Depends(get_current_user)):
+    '''
+    게시글 일괄 등록 함수
+
+    요청 body의 NDJSON(한 줄에 {"title": ..., "content": ...} 하나)을 stream으로 읽어 게시글을 일괄 등록
+    IMPORT_BATCH_SIZE개씩 INSERT하며, 형식이 잘못된 줄은 전체를 중단하지 않고 오류로 기록
+
+        Arguements:
+            board_id (int): 게시글을 등록할 게시판 ID
+            request (Request): NDJSON body를 읽을 요청
+            db (AsyncSession): DB 세션
+            rd (Redis): Redis 연결
+            curr_user_id (int): 현재 로그인된 유저 ID
+
+        Raises:
+            HTTP_401_UNAUTHORIZED: 해당 게시판에 게시글 작성 권한이 없는 경우
+            HTTP_404_NOT_FOUND: 해당 게시판이 존재하지 않는 경우
+
+        Returns:
+            imported (int): 등록된 게시글 수
+            failed (int): 등록에 실패한 줄 수
+            errors (list): 실패한 줄 번호와 오류 내용 목록
+    '''
+    _board = await get_board_from_db(board_id, db)
+    auth_board_read(_board, curr_user_id)
+    return await import_posts(iter_lines(request.stream()), board_id, _board.public, curr_user_id, db, rd)
+
+
 @router.patch("/update/{post_id}")
-def post_update(post_id: int,
-                updated_post: post_schema.Post,
-                db: Session = Depends(get_db),
-                curr_user_id: int = Depends(get_current_user)):
+@query_budget(2)
+async def post_update(post_id: int,
+                      updated_post: post_schema.Post,
+                      db: AsyncSession = Depends(get_db),
+                      rd: Redis = Depends(get_redis),
+                      curr_user_id: int = Depends(get_current_user)):
     '''
     게시글 수정 함수
 
-    입력받은 id가 일치하는 게시글의 title과 content를 수정하고 DB 저장
+    입력받은 id가 일치하는 게시글의 title과 content(요약 포함)를 수정하고 DB 저장
 
         Arguements:
             post_id (int): 수정할 게시글 ID
             updated_post (Post): 게시글 입력 Schema
-            db (Session): DB 세션
+            db (AsyncSession): DB 세션
+            rd (Redis): Redis 연결
             curr_user_id (int): 현재 로그인된 유저 ID
 
         Raises:
@@ -74,58 +135,75 @@ def post_update(post_id: int,
         Returns:
             게시글 수정 완료 메시지
     '''
-    _post = get_post_from_db(post_id, db)
+    _post = await get_post_from_db(post_id, db)
     auth_post_edit(_post, curr_user_id)
     _post.title = updated_post.title
     _post.content = updated_post.content
-    db.commit()
+    _post.excerpt = make_excerpt(updated_post.content)
+    await db.commit()
+    await bump_versions(rd, ("post", post_id), ("board_posts", _post.board_id))
     return {'msg': '게시글이 수정되었습니다.'}
 
 
 @router.delete("/delete/{post_id}")
-def post_delete(post_id : int,
-                db: Session = Depends(get_db),
-                curr_user_id: int = Depends(get_current_user)):
+@query_budget(2)
+async def post_delete(post_id : int,
+                      db: AsyncSession = Depends(get_db),
+                      rd: Redis = Depends(get_redis),
+                      curr_user_id: int = Depends(get_current_user)):
     '''
     게시글 삭제 함수
 
-    게시글 id를 입력받아 해당 게시글을 DB에서 삭제, 게시판의 post count 수정
+    게시글 id를 입력받아 해당 게시글을 DB에서 삭제, 게시판의 게시글 수 변경량을 redis에 누적
 
         Arguements:
             post_id (int): 삭제할 게시글의 ID
-            db (Session): DB 세션
+            db (AsyncSession): DB 세션
+            rd (Redis): Redis 연결
             curr_user_id (int): 현재 로그인된 유저 ID
 
         Raises:
             HTTP_401_UNAUTHORIZED: 해당 게시글 삭제 권한이 없는 경우
             HTTP_404_NOT_FOUND: 해당 게시글이 존재하지 않는 경우
-            HTTP_404_NOT_FOUND: 게시글이 작성된 게시판이 존재하지 않는 경우
 
         Returns:
             삭제 완료 메시지
     '''
-    _post = get_post_from_db(post_id, db)
+    _post = await get_post_from_db(post_id, db)
     auth_post_edit(_post, curr_user_id)
-    _board = get_board_from_db(_post.board_id, db)
-    _board.post_count -= 1
-    db.delete(_post)
-    db.commit()
+    await db.delete(_post)
+    await db.commit()
+    await incr_post_count(rd, _post.board_id, -1)
+    await rank_incr(rd, _post.board_id, -1)
+    await feed_remove(rd, _post.board_id, post_id)
+    await discard_views(rd, _post.board_id, post_id)
+    await bump_versions(rd, ("post", post_id), ("board_posts", _post.board_id), ("board_list", 0))
     return {'msg':'삭제되었습니다.'}
 
 
-@router.get("/get/{post_id}")
-def post_detail(post_id : int,
-                db: Session = Depends(get_db),
-                curr_user_id: int = Depends(get_current_user)):
+@router.get("/get/{post_id}", response_model=post_schema.PostOut)
+@query_budget(2)
+async def post_detail(post_id : int,
+                      response: Response,
+                      db: AsyncSession = Depends(get_db),
+                      rd: Redis = Depends(get_redis),
+                      curr_user_id: int = Depends(get_current_user),
+                      if_none_match: str | None = Header(None)):
     '''
     게시글 상세 조회 함수
 
     게시글 ID를 입력받아 해당 게시글을 조회
+    게시글과 게시판 정보는 redis 캐시에서 조회하고, 캐시가 없거나 수정된 경우에만 DB에서 조회
+    게시글 version으로 ETag를 생성하여 If-None-Match와 일치하면 304 반환
+    조회수는 DB를 수정하지 않고 redis에 누적 (304 응답 포함)
 
         Arguements:
             post_id (int): 조회할 게시글의 ID
-            db (Session): DB 세션
+            response (Response): ETag header를 설정할 응답
+            db (AsyncSession): DB 세션
+            rd (Redis): Redis 연결
             curr_user_id (int): 현재 로그인된 유저 ID
+            if_none_match (str): 클라이언트가 가진 ETag
 
         Raises:
             HTTP_401_UNAUTHORIZED: 해당 게시글 조회 권한이 없는 경우
@@ -134,26 +212,155 @@ def post_detail(post_id : int,
         Returns:
             조회하는 게시글 객체
     '''
-    _post = get_post_from_db(post_id, db)
-    auth_board_read(_post.board, curr_user_id)
+    _post, post_version = await get_cached_post(post_id, rd)
+    _board, _ = await get_cached_board(_post.board_id, rd)
+    auth_board_read(_board, curr_user_id)
+    await record_view(rd, _post.board_id, post_id, curr_user_id)
+    etag = make_etag("post", post_id, post_version)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
     return _post
 
 
-@router.get("/list/{board_id}/{page}")
-def post_list(board_id: int,
-              db: Session = Depends(get_db),
-              curr_user_id: int = Depends(get_current_user),
-              page: int = 0):
+@router.get("/batch", response_model=post_schema.PostBatch)
+@query_budget(2)
+async def post_batch(ids: str,
+                     db: AsyncSession = Depends(get_db),
+                     curr_user_id: int = Depends(get_current_user)):
+    '''
+    게시글 일괄 조회 함수
+
+    쉼표로 구분된 여러 게시글 ID를 조회, 게시글과 게시글이 속한 게시판을 각각 하나의 IN 쿼리로 조회하고
+    게시판 접근 권한을 한 번에 확인
+
+        Arguements:
+            ids (str): 쉼표로 구분된 게시글 ID 목록 (최대 BATCH_MAX_IDS개)
+            db (AsyncSession): DB 세션
+            curr_user_id (int): 현재 로그인된 유저 ID
+
+        Raises:
+            HTTP_400_BAD_REQUEST: ID 목록 형식이 올바르지 않거나 최대 개수를 초과한 경우
+
+        Returns:
+            found (list): 조회된 게시글 목록
+            forbidden (list): 게시판 접근 권한이 없는 게시글 ID 목록
+            missing (list): 존재하지 않는 게시글 ID 목록
+    '''
+    post_ids = parse_ids(ids)
+    posts = {post.id: post for post in
+             await db.scalars(select(Post).options(undefer(Post.content)).where(Post.id.in_(post_ids)))}
+    board_ids = {post.board_id for post in posts.values()}
+    boards = {}
+    if board_ids:
+        boards = {board.id: board for board in await db.scalars(select(Board).where(Board.id.in_(board_ids)))}
+    found, forbidden, missing = [], [], []
+    for post_id in post_ids:
+        _post = posts.get(post_id)
+        # 게시글 조회 후 게시판이 삭제된 경우 게시글도 함께 삭제되므로 존재하지 않는 게시글로 처리
+        _board = boards.get(_post.board_id) if _post is not None else None
+        if _board is None:
+            missing.append(post_id)
+        elif can_read_board(_board, curr_user_id):
+            found.append(_post)
+        else:
+            forbidden.append(post_id)
+    return {"found": found, "forbidden": forbidden, "missing": missing}
+
+
+_POST_ITEM_COLUMNS = (Post.id, Post.board_id, Post.user_id, Post.title, Post.excerpt)
+
+
+async def _fetch_posts(query):
+    '''
+    게시글 목록 조회 결과를 dict 목록으로 반환, 동시에 같은 목록을 조회하는 요청과 공유되므로 요청 세션이 아닌 별도 세션에서 조회
+    '''
+    async with SessionLocal() as db:
+        return [dict(row) for row in (await db.execute(query)).mappings()]
+
+
+@router.get("/list/{board_id}", response_model=post_schema.PostCursorList)
+@query_budget(2)
+async def post_list_cursor(board_id: int,
+                           response: Response,
+                           db: AsyncSession = Depends(get_db),
+                           rd: Redis = Depends(get_redis),
+                           curr_user_id: int = Depends(get_current_user),
+                           cursor: str | None = None,
+                           if_none_match: str | None = Header(None)):
+    '''
+    게시글 목록 cursor 조회 함수
+
+    cursor 이후의 게시글 목록을 id 순서로 조회 (keyset pagination)
+    같은 cursor를 동시에 조회하는 요청은 하나의 쿼리 결과를 공유 (게시글 version이 같은 경우에만, 수정 이후의 요청은 새로 조회)
+    게시판의 게시글 version으로 ETag를 생성하여 If-None-Match와 일치하면 게시글을 조회하지 않고 304 반환
+
+        Arguements:
+            board_id (int): 조회하려는 게시판 ID
+            response (Response): ETag header를 설정할 응답
+            db (AsyncSession): DB 세션
+            rd (Redis): Redis 연결
+            curr_user_id (int): 현재 로그인된 유저 ID
+            cursor (str): 이전 응답의 next_cursor, 첫 페이지는 생략
+            if_none_match (str): 클라이언트가 가진 ETag
+
+        Raises:
+            HTTP_400_BAD_REQUEST: cursor 형식이 올바르지 않은 경우
+            HTTP_401_UNAUTHORIZED: 해당 게시판 조회 권한이 없는 경우
+            HTTP_404_NOT_FOUND: 해당 게시판이 존재하지 않는 경우
+
+        Returns:
+            post_count (int): 전체 게시글 수
+            post_list (list): cursor 이후의 게시글 목록 (content 대신 excerpt 포함)
+            next_cursor (str): 다음 페이지 cursor, 마지막 페이지인 경우 None
+    '''
+    _board, _ = await get_cached_board(board_id, rd)
+    auth_board_read(_board, curr_user_id)
+    size = get_settings().PAGE_SIZE
+    posts_version, = await get_versions(rd, ("board_posts", board_id))
+    post_count = _board.post_count + await pending_post_count(rd, board_id)
+    etag = make_etag("post_list_cursor", board_id, cursor, size, posts_version, post_count)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
+    _query = select(*_POST_ITEM_COLUMNS).filter(Post.board_id == board_id)
+    if cursor:
+        last_id, = decode_cursor(cursor, int)
+        _query = _query.filter(Post.id > last_id)
+    _post_list = await single_flight.do(("post_list_cursor", board_id, cursor, size, posts_version),
+                                        lambda: _fetch_posts(_query.order_by(Post.id).limit(size + 1)))
+    next_cursor = encode_cursor(_post_list[size - 1]["id"]) if len(_post_list) > size else None
+    return {
+        "post_count": post_count,
+        "post_list": _post_list[:size],
+        "next_cursor": next_cursor
+    }
+
+
+@router.get("/list/{board_id}/{page}", response_model=post_schema.PostList)
+@query_budget(2)
+async def post_list(board_id: int,
+                    response: Response,
+                    db: AsyncSession = Depends(get_db),
+                    rd: Redis = Depends(get_redis),
+                    curr_user_id: int = Depends(get_current_user),
+                    page: int = Path(ge=0),
+                    if_none_match: str | None = Header(None)):
     '''
     게시글 목록 조회 함수
 
     전체 게시글 목록을 조회
+    같은 페이지를 동시에 조회하는 요청은 하나의 쿼리 결과를 공유 (게시글 version이 같은 경우에만, 수정 이후의 요청은 새로 조회)
+    게시판의 게시글 version으로 ETag를 생성하여 If-None-Match와 일치하면 게시글을 조회하지 않고 304 반환
 
         Arguements:
             board_id (int): 조회하려는 게시판 ID
-            db (Session): DB 세션
+            response (Response): ETag header를 설정할 응답
+            db (AsyncSession): DB 세션
+            rd (Redis): Redis 연결
             curr_user_id (int): 현재 로그인된 유저 ID
             page (int): 조회하려는 게시글 목록의 페이지
+            if_none_match (str): 클라이언트가 가진 ETag
 
         Raises:
             HTTP_401_UNAUTHORIZED: 해당 게시판 조회 권한이 없는 경우
@@ -161,13 +368,124 @@ def post_list(board_id: int,
 
         Returns:
             post_count (int): 전체 게시글 수
-            post_list (list): 해당 페이지의 게시글 목록
+            post_list (list): 해당 페이지의 게시글 목록 (content 대신 excerpt 포함)
+    '''
+    _board, _ = await get_cached_board(board_id, rd)
+    auth_board_read(_board, curr_user_id)
+    size = get_settings().PAGE_SIZE
+    posts_version, = await get_versions(rd, ("board_posts", board_id))
+    post_count = _board.post_count + await pending_post_count(rd, board_id)
+    etag = make_etag("post_list", board_id, page, size, posts_version, post_count)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
+    _query = select(*_POST_ITEM_COLUMNS).filter(Post.board_id == board_id).order_by(Post.id)
+    _post_list = await single_flight.do(("post_list", board_id, page, size, posts_version),
+                                        lambda: _fetch_posts(_query.offset(page*size).limit(size)))
+    return {
+        "post_count": post_count,
+        "post_list": _post_list
+    }
+
+
+@router.get("/feed", response_model=post_schema.PostFeed)
+@query_budget(2)
+async def post_feed(db: AsyncSession = Depends(get_db),
+                    rd: Redis = Depends(get_redis),
+                    curr_user_id: int = Depends(get_current_user),
+                    cursor: str | None = None):
+    '''
+    게시글 feed 조회 함수
+
+    모든 공개 게시판과 현재 유저의 비공개 게시판의 게시글을 최신순으로 cursor 이후부터 조회 (keyset pagination)
+    redis에 게시판별로 유지하는 최신 게시글 ID 목록(feed)을 병합하여 조회하므로 게시글 table을 탐색하지 않음
+
+        Arguements:
+            db (AsyncSession): DB 세션
+            rd (Redis): Redis 연결
+            curr_user_id (int): 현재 로그인된 유저 ID
+            cursor (str): 이전 응답의 next_cursor, 첫 페이지는 생략
+
+        Raises:
+            HTTP_400_BAD_REQUEST: cursor 형식이 올바르지 않은 경우
+
+        Returns:
+            post_list (list): 최신 게시글 목록 (content 대신 excerpt 포함)
+            next_cursor (str): 다음 페이지 cursor, 마지막 페이지인 경우 None
+    '''
+    size = get_settings().PAGE_SIZE
+    before = decode_cursor(cursor, int)[0] if cursor else None
+    _post_list = await feed_page(rd, db, curr_user_id, size, before)
+    next_cursor = encode_cursor(_post_list[size - 1]["id"]) if len(_post_list) > size else None
+    return {
+        "post_list": _post_list[:size],
+        "next_cursor": next_cursor
+    }
+
+
+@router.get("/popular/{board_id}", response_model=post_schema.PostPopular)
+@query_budget(1)
+async def post_popular(board_id: int,
+                       db: AsyncSession = Depends(get_db),
+                       rd: Redis = Depends(get_redis),
+                       curr_user_id: int = Depends(get_current_user),
+                       limit: int = Query(10, ge=1, le=100)):
+    '''
+    게시판 인기 게시글 조회 함수
+
+    게시판에서 조회수가 많은 게시글을 redis의 조회수 순위로 조회 (게시글 table을 조회하지 않음)
+
+        Arguements:
+            board_id (int): 조회하려는 게시판 ID
+            db (AsyncSession): DB 세션
+            rd (Redis): Redis 연결
+            curr_user_id (int): 현재 로그인된 유저 ID
+            limit (int): 조회할 게시글 수 (최대 100)
+
+        Raises:
+            HTTP_401_UNAUTHORIZED: 해당 게시판 조회 권한이 없는 경우
+            HTTP_404_NOT_FOUND: 해당 게시판이 존재하지 않는 경우
+
+        Returns:
+            post_list (list): 게시글 ID, 조회수, 순 조회자 수 목록 (조회수 역순)
     '''
-    _board = get_board_from_db(board_id, db)
+    _board, _ = await get_cached_board(board_id, rd)
     auth_board_read(_board, curr_user_id)
-    _post_list = db.query(Board).get(board_id).posts
-    size = Settings().PAGE_SIZE
+    return {"post_list": await most_viewed(rd, board_id, limit)}
+
+
+@router.get("/search", response_model=post_schema.PostSearchList)
+@query_budget(1)
+async def post_search(q: str,
+                      db: AsyncSession = Depends(get_db),
+                      curr_user_id: int = Depends(get_current_user),
+                      cursor: str | None = None):
+    '''
+    게시글 검색 함수
+
+    제목과 내용에 검색어가 포함된 게시글을 검색 점수 순서로 조회 (keyset pagination)
+    조회 권한이 있는 게시판의 게시글만 검색
+
+        Arguements:
+            q (str): 검색어
+            db (AsyncSession): DB 세션
+            curr_user_id (int): 현재 로그인된 유저 ID
+            cursor (str): 이전 응답의 next_cursor, 첫 페이지는 생략
+
+        Raises:
+            HTTP_400_BAD_REQUEST: 검색어가 비어 있거나 cursor 형식이 올바르지 않은 경우
+
+        Returns:
+            post_list (list): 검색 결과 게시글 목록 (content 대신 excerpt 포함)
+            next_cursor (str): 다음 페이지 cursor, 마지막 페이지인 경우 None
+    '''
+    size = get_settings().PAGE_SIZE
+    after = decode_cursor(cursor, float, int) if cursor else None
+    _post_list = await search_posts(q, curr_user_id, db, size, after)
+    next_cursor = None
+    if len(_post_list) > size:
+        next_cursor = encode_cursor(_post_list[size - 1]["rank"], _post_list[size - 1]["id"])
     return {
-        "post_count": len(_post_list),
-        "post_list": _post_list[page*size:page*size+size]
-    }
\ No newline at end of file
+        "post_list": _post_list[:size],
+        "next_cursor": next_cursor
+    }
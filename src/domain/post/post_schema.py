@@ -1,4 +1,4 @@
-from pydantic import BaseModel, validator
+from pydantic import BaseModel, ConfigDict, validator
 from fastapi import status, HTTPException
 
 
@@ -23,4 +23,155 @@ class Post(BaseModel):
         '''
         if not v or ( type(v)==str and not v.strip() ):
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="빈 칸을 모두 채워주세요")
-        return v
\ No newline at end of file
+        return v
+
+
+class PostItem(BaseModel):
+    '''
+    게시글 목록 항목 응답 Schema, 목록 응답 크기를 줄이기 위해 content 대신 요약(excerpt)만 포함
+
+        Attributes:
+            id (int): 게시글 ID
+            board_id (int): 게시글이 속한 게시판 ID
+            user_id (int): 게시글 작성자 ID
+            title (str): 게시글의 제목
+            excerpt (str): 게시글 요약
+    '''
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    board_id: int
+    user_id: int
+    title: str
+    excerpt: str
+
+
+class PostOut(PostItem):
+    '''
+    게시글 상세 조회 응답 Schema
+
+        Attributes:
+            content (str): 게시글의 내용
+    '''
+    content: str
+
+
+class PostList(BaseModel):
+    '''
+    게시글 목록 조회 응답 Schema
+
+        Attributes:
+            post_count (int): 전체 게시글 수
+            post_list (list[PostItem]): 해당 페이지의 게시글 목록
+    '''
+    post_count: int
+    post_list: list[PostItem]
+
+
+class PostCursorList(PostList):
+    '''
+    게시글 목록 cursor 조회 응답 Schema
+
+        Attributes:
+            next_cursor (str): 다음 페이지 cursor, 마지막 페이지인 경우 None
+    '''
+    next_cursor: str | None
+
+
+class PostSearchItem(PostItem):
+    '''
+    게시글 검색 결과 항목 응답 Schema
+
+        Attributes:
+            rank (float): 검색 점수, 높을수록 검색어와 관련도가 높음
+    '''
+    rank: float
+
+
+class PostSearchList(BaseModel):
+    '''
+    게시글 검색 응답 Schema
+
+        Attributes:
+            post_list (list[PostSearchItem]): 검색 결과 게시글 목록
+            next_cursor (str): 다음 페이지 cursor, 마지막 페이지인 경우 None
+    '''
+    post_list: list[PostSearchItem]
+    next_cursor: str | None
+
+
+class PostImportError(BaseModel):
+    '''
+    게시글 일괄 등록 오류 Schema
+
+        Attributes:
+            line (int): 오류가 발생한 줄 번호 (1부터 시작)
+            detail (str): 오류 내용
+    '''
+    line: int
+    detail: str
+
+
+class PostImportResult(BaseModel):
+    '''
+    게시글 일괄 등록 응답 Schema
+
+        Attributes:
+            imported (int): 등록된 게시글 수
+            failed (int): 등록에 실패한 줄 수
+            errors (list[PostImportError]): 실패한 줄의 오류 목록 (최대 IMPORT_MAX_ERRORS개)
+    '''
+    imported: int
+    failed: int
+    errors: list[PostImportError]
+
+
+class PostBatch(BaseModel):
+    '''
+    게시글 일괄 조회 응답 Schema
+
+        Attributes:
+            found (list[PostOut]): 조회된 게시글 목록 (요청 순서)
+            forbidden (list[int]): 게시판 접근 권한이 없는 게시글 ID 목록
+            missing (list[int]): 존재하지 않는 게시글 ID 목록
+    '''
+    found: list[PostOut]
+    forbidden: list[int]
+    missing: list[int]
+
+
+class PostFeed(BaseModel):
+    '''
+    게시글 feed 응답 Schema
+
+        Attributes:
+            post_list (list[PostItem]): 최신 게시글 목록
+            next_cursor (str): 다음 페이지 cursor, 마지막 페이지인 경우 None
+    '''
+    post_list: list[PostItem]
+    next_cursor: str | None
+
+
+class PostViews(BaseModel):
+    '''
+    게시글 조회수 Schema
+
+        Attributes:
+            post_id (int): 게시글 ID
+            view_count (int): 조회수
+            viewers (int): 순 조회자 수 (HyperLogLog 추정값, 기록하지 않는 경우 None)
+    '''
+    post_id: int
+    view_count: int
+    viewers: int | None
+
+
+class PostPopular(BaseModel):
+    '''
+    인기 게시글 응답 Schema
+
+        Attributes:
+            post_list (list[PostViews]): 조회수가 많은 게시글 목록
+    '''
+    post_list: list[PostViews]
+
@@ -3,82 +3,95 @@ import secrets
 
 from fastapi import APIRouter, Depends, status, HTTPException
 from fastapi.security import OAuth2PasswordRequestForm, OAuth2PasswordBearer
-from sqlalchemy.orm import Session
-from passlib.context import CryptContext
+from sqlalchemy.ext.asyncio import AsyncSession
+from redis.asyncio import Redis
 
 from src.core.models import User
 from src.core.db_config import get_db
+from src.core.query_budget import query_budget
 from src.domain.user import user_schema
 from src.core.redis_config import get_redis
-from src.utils.config import Settings
-from src.utils.validator import user_email_validator
-from src.utils.db_utils import get_user_from_db
+from src.utils.config import get_settings
+from src.utils.db_utils import get_user_from_db, insert_unique
+from src.utils.token_cache import invalidate_token
+from src.utils.password import hash_password, verify_password
 
 router = APIRouter(
     prefix="/user"
 )
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl='/user/login')
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 
 @router.post("/signup")
-def user_create(created_user: user_schema.CreateUser, db: Session = Depends(get_db)):
+@query_budget(1)
+async def user_create(created_user: user_schema.CreateUser, db: AsyncSession = Depends(get_db)):
     '''
     유저 생성 (회원가입) 함수
 
     새로운 유저를 생성하고 DB에 저장
+    비밀번호 hash 대기 중에 DB 연결을 점유하지 않도록 hash를 먼저 생성한 후 DB에 저장
+    이메일 중복은 별도로 조회하지 않고 INSERT 한 번으로 DB의 unique 제약 충돌 여부를 확인
 
         Arguements:
             created_user (CreateUser): 유저 생성 입력 Schema
-            db (Session): DB 세션
+            db (AsyncSession): DB 세션
 
         Raises:
             HTTP_400_BAD_REQUEST: 같은 이메일 계정이 이미 있는 경우
+            HTTP_503_SERVICE_UNAVAILABLE: 비밀번호 hash 요청이 너무 많은 경우
 
         Returns:
             회원가입 완료 메시지
     '''
-    user_email_validator(created_user.email, db)
-    _user = User(
-        email = created_user.email,
-        fullname = created_user.fullname,
-        password = pwd_context.hash(created_user.password1)
-    )
-    try:
-        db.add(_user)
-        db.commit()
-    except:
+    password = await hash_password(created_user.password1)
+    user_id = await insert_unique(User, {
+        "email": created_user.email,
+        "fullname": created_user.fullname,
+        "password": password
+    }, User.email, db)
+    if user_id is None:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="같은 이메일의 계정이 이미 존재합니다.")
+    await db.commit()
     return {'msg': '회원가입이 완료되었습니다.'}
 
 
 @router.post("/login")
-def login(form: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
+@query_budget(2)
+async def login(form: OAuth2PasswordRequestForm = Depends(),
+                db: AsyncSession = Depends(get_db),
+                rd: Redis = Depends(get_redis)):
     '''
     유저 로그인 함수
 
     입력받은 유저 정보를 검증한 후 redis에 저장
+    저장된 비밀번호 hash의 cost가 BCRYPT_ROUNDS와 다르면 새로운 hash로 갱신
+    비밀번호 확인 대기 중에 DB 연결을 점유하지 않도록 유저 조회 후 transaction을 종료하여 연결을 pool에 반환
 
         Arguements:
             form (OAuth2PasswordRequestForm): 유저 로그인 form
-            db (Session): DB 세션
+            db (AsyncSession): DB 세션
+            rd (Redis): Redis 연결
 
         Raises:
             HTTP_401_UNAUTHORIZED: 이메일과 일치하는 계정이 없는 경우
             HTTP_401_UNAUTHORIZED: 비밀번호가 일치하지 않는 경우
+            HTTP_503_SERVICE_UNAVAILABLE: 비밀번호 확인 요청이 너무 많은 경우
 
         Returns:
             access_token: 권한 인증 access token
             token_type: Bearer
             user_email: 로그인한 유저의 이메일
     '''
-    _user = get_user_from_db(form.username, db)
-    if not pwd_context.verify(form.password, _user.password):
+    _user = await get_user_from_db(form.username, db)
+    await db.commit()
+    verified, new_hash = await verify_password(form.password, _user.password)
+    if not verified:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail='비밀번호가 일치하지 않습니다.')
+    if new_hash:
+        _user.password = new_hash
+        await db.commit()
     access_token = secrets.token_hex(32)
-    rd = get_redis()
-    rd.set(access_token, _user.id)
-    rd.expire(access_token, Settings().ACCESS_TOKEN_EXPIRE_SECONDS)
+    await rd.set(access_token, _user.id, ex=get_settings().ACCESS_TOKEN_EXPIRE_SECONDS)
     return {
         "access_token": access_token,
         "token_type": "bearer",
@@ -87,18 +100,21 @@ def login(form: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get
 
 
 @router.post("/logout")
-def logout(token: Annotated[str, Depends(oauth2_scheme)]):
+@query_budget(0)
+async def logout(token: Annotated[str, Depends(oauth2_scheme)],
+                 rd: Redis = Depends(get_redis)):
     '''
     유저 로그아웃 함수
 
-    입력받은 access token을 redis에서 삭제
+    입력받은 access token을 redis에서 삭제하고, 모든 worker의 token 캐시에서 삭제
 
         Arguements:
-                token (str): 현재 로그인되어 있는 access token 
+                token (str): 현재 로그인되어 있는 access token
+                rd (Redis): Redis 연결
 
         Returns:
             로그아웃 완료 메시지
     '''
-    rd = get_redis()
-    rd.delete(token)
+    await rd.delete(token)
+    await invalidate_token(token, rd)
     return {"msg":"정상적으로 로그아웃되었습니다."}
\ No newline at end of file
@@ -1,20 +1,27 @@
+import secrets
 from typing import Annotated
 
-from fastapi import Depends, status, HTTPException
+from fastapi import Depends, Header, status, HTTPException
+from redis.asyncio import Redis
 
 from src.core.models import Board, Post
 from src.core.redis_config import get_redis
+from src.utils.config import get_settings
+from src.utils.token_cache import token_cache
 from src.domain.user.user_router import oauth2_scheme
 
 
-def get_current_user(token: Annotated[str, Depends(oauth2_scheme)]):
+async def get_current_user(token: Annotated[str, Depends(oauth2_scheme)],
+                           rd: Redis = Depends(get_redis)):
     '''
     현재 유저 정보 조회 함수
 
     인증 token으로 redis 로그인 세션을 조회하여 일치하는 유저의 id를 반환
+    조회한 결과는 redis 만료 시간을 넘지 않는 범위에서 프로세스 메모리에 캐시
     
         Attributes:
                 token (str): 현재 로그인되어 있는 access token
+                rd (Redis): Redis 연결
             
         Raises:
             HTTP_401_UNAUTHORIZED: token이 redis에 저장되어 있지 않는 경우
@@ -22,11 +29,18 @@ def get_current_user(token: Annotated[str, Depends(oauth2_scheme)]):
         Returns:
             user_id (int): 현재 token에 해당하는 유저 ID
     '''
-    rd = get_redis()
-    user_id = rd.get(token)
+    user_id = token_cache.get(token)
+    if user_id is not None:
+        return user_id
+    pipe = rd.pipeline(transaction=False)
+    pipe.get(token)
+    pipe.pttl(token)
+    user_id, ttl_ms = await pipe.execute()
     if not user_id:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail='로그인이 필요합니다.')
-    return int(user_id)
+    user_id = int(user_id)
+    token_cache.set(token, user_id, ttl_ms / 1000 if ttl_ms > 0 else token_cache.ttl)
+    return user_id
 
 def auth_board_edit(board: Board, user_id: int):
     '''
@@ -48,6 +62,21 @@ def auth_board_edit(board: Board, user_id: int):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="해당 게시판에 대한 수정 권한이 없습니다.")
     return
 
+def can_read_board(board: Board, user_id: int):
+    '''
+    게시판 접근 가능 여부 함수
+
+    게시판이 공개되어 있거나 현재 유저가 생성한 게시판인지 확인, 여러 게시판을 한 번에 확인할 때 사용
+
+        Attributes:
+                board (Board): 권한을 확인하려는 게시판 객체
+                user_id (int): 현재 유저의 ID
+
+        Returns:
+            접근 권한이 있으면 True
+    '''
+    return board.public or board.user_id == user_id
+
 def auth_board_read(board: Board, user_id: int):
     '''
     게시판 접근 권한 확인 함수
@@ -64,7 +93,7 @@ def auth_board_read(board: Board, user_id: int):
         Returns:
             None
     '''
-    if not board.public and board.user_id != user_id:
+    if not can_read_board(board, user_id):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="해당 게시판에 대한 접근 권한이 없습니다.")
     return
 
@@ -86,4 +115,25 @@ def auth_post_edit(post: Post, user_id: int):
     '''
     if post.user_id != user_id:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="해당 게시글에 대한 수정 권한이 없습니다.")
-    return
\ No newline at end of file
+    return
+
+def auth_monitor(x_monitor_token: Annotated[str, Header()] = ""):
+    '''
+    monitor 접근 권한 확인 함수
+
+    X-Monitor-Token header가 설정된 MONITOR_TOKEN과 일치하는지 확인
+    MONITOR_TOKEN이 설정되지 않은 경우 항상 거부
+
+        Attributes:
+                x_monitor_token (str): 요청의 X-Monitor-Token header 값
+
+        Raises:
+            HTTP_403_FORBIDDEN: token이 설정되지 않았거나 일치하지 않는 경우
+
+        Returns:
+            None
+    '''
+    expected = get_settings().MONITOR_TOKEN
+    if not expected or not secrets.compare_digest(x_monitor_token.encode(), expected.encode()):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="monitor 접근 권한이 없습니다.")
+    return
@@ -0,0 +1,30 @@
+from fastapi import HTTPException, status
+
+from src.utils.config import get_settings
+
+
+def parse_ids(ids: str):
+    '''
+    일괄 조회 ID 목록 해석 함수
+
+    쉼표로 구분된 ID 문자열을 중복을 제외한 정수 목록으로 변환 (입력 순서 유지)
+
+        Arguments:
+            ids (str): 쉼표로 구분된 ID 목록 (예: "1,2,3")
+
+        Raises:
+            HTTP_400_BAD_REQUEST: 정수가 아닌 ID가 있거나 ID가 없는 경우, BATCH_MAX_IDS보다 많은 경우
+
+        Returns:
+            ID 목록
+    '''
+    try:
+        parsed = list(dict.fromkeys(int(i) for i in ids.split(",") if i.strip()))
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="잘못된 ID 목록입니다.")
+    if not parsed:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="조회할 ID를 입력해주세요.")
+    max_ids = get_settings().BATCH_MAX_IDS
+    if len(parsed) > max_ids:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"한 번에 최대 {max_ids}개까지 조회할 수 있습니다.")
+    return parsed
@@ -0,0 +1,142 @@
+import asyncio
+import uuid
+
+from redis.asyncio import Redis
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.db_config import SessionLocal
+from src.core.models import Board
+from src.core.redis_config import init_redis, close_redis, get_redis
+from src.utils.counters import POST_COUNT_DELTA_KEY, pending_deltas, pending_post_counts
+
+BOARD_RANK_KEY = "board:rank:public"
+
+
+def _member(board_id: int):
+    '''
+    ZSET member 이름, 같은 게시글 수에서 id 역순으로 정렬되도록 0으로 채운 문자열 사용
+    '''
+    return f"{board_id:012d}"
+
+
+async def rank_set(rd: Redis, board_id: int, post_count: int):
+    '''
+    공개 게시판을 게시글 수와 함께 순위에 추가
+    '''
+    await rd.zadd(BOARD_RANK_KEY, {_member(board_id): post_count})
+
+
+async def rank_remove(rd: Redis, board_id: int):
+    '''
+    게시판을 순위에서 삭제 (비공개 전환 또는 삭제)
+    '''
+    await rd.zrem(BOARD_RANK_KEY, _member(board_id))
+
+
+async def rank_incr(rd: Redis, board_id: int, delta: int):
+    '''
+    게시판의 게시글 수 순위 변경, 순위에 있는 공개 게시판만 수정 (ZADD XX INCR)
+    '''
+    await rd.zadd(BOARD_RANK_KEY, {_member(board_id): delta}, xx=True, incr=True)
+
+
+async def board_rank_page(rd: Redis, db: AsyncSession, user_id: int, page: int, size: int):
+    '''
+    게시판 순위 조회 함수
+
+    공개 게시판은 redis ZSET에서, 현재 유저의 비공개 게시판은 DB에서 조회하여 게시글 수 역순으로 병합한 후 해당 페이지를 반환
+    같은 게시글 수에서는 공개 게시판이 비공개 게시판보다 앞에 위치
+
+        Arguments:
+            rd (Redis): Redis 연결
+            db (AsyncSession): DB 세션
+            user_id (int): 현재 로그인된 유저 ID
+            page (int): 조회하려는 페이지
+            size (int): 페이지 크기
+
+        Returns:
+            total (int): 접근 가능한 전체 게시판 수
+            boards (list): 해당 페이지의 게시판 목록
+    '''
+    page = max(page, 0)
+    private = (await db.scalars(select(Board).filter(Board.user_id == user_id, ~Board.public))).all()
+    public_total = await rd.zcard(BOARD_RANK_KEY)
+    pending = await pending_post_counts(rd, [b.id for b in private])
+    scores = {b.id: b.post_count + p for b, p in zip(private, pending)}
+    private = sorted(private, key=lambda b: (scores[b.id], b.id), reverse=True)
+
+    positions = []
+    if private:
+        pipe = rd.pipeline(transaction=False)
+        for b in private:
+            pipe.zcount(BOARD_RANK_KEY, scores[b.id], "+inf")
+        positions = [ahead + j for j, ahead in enumerate(await pipe.execute())]
+
+    start, end = page*size, page*size + size
+    private_in_page = {pos - start: b for pos, b in zip(positions, private) if start <= pos < end}
+    public_start = start - sum(1 for pos in positions if pos < start)
+    public_size = size - len(private_in_page)
+    public_ids = []
+    if public_size > 0:
+        members = await rd.zrevrange(BOARD_RANK_KEY, public_start, public_start + public_size - 1)
+        public_ids = [int(m) for m in members]
+
+    boards = {}
+    if public_ids:
+        boards = {b.id: b for b in await db.scalars(select(Board).filter(Board.id.in_(public_ids)))}
+    public_boards = iter(boards[i] for i in public_ids if i in boards)
+    page_boards = []
+    for slot in range(size):
+        board = private_in_page.get(slot) or next(public_boards, None)
+        if board is None:
+            break
+        page_boards.append(board)
+    return public_total + len(private), page_boards
+
+
+async def rebuild_board_rank(rd: Redis, db: AsyncSession):
+    '''
+    게시판 순위 재생성 함수
+
+    DB의 공개 게시판과 아직 반영되지 않은 게시글 수 변경량으로 ZSET을 새로 만든 후 기존 ZSET과 교체
+    재생성 중에 변경된 게시글 수는 다음 재생성 또는 게시글 작성 시까지 반영되지 않을 수 있음
+
+        Returns:
+            순위에 추가한 게시판 수
+    '''
+    pending = await pending_deltas(rd, POST_COUNT_DELTA_KEY)
+    tmp = f"{BOARD_RANK_KEY}:rebuild:{uuid.uuid4().hex}"
+    total = 0
+    result = await db.stream(select(Board.id, Board.post_count).filter(Board.public).execution_options(yield_per=1000))
+    async for rows in result.partitions():
+        await rd.zadd(tmp, {_member(i): count + pending.get(i, 0) for i, count in rows})
+        total += len(rows)
+    if total:
+        await rd.rename(tmp, BOARD_RANK_KEY)
+    else:
+        await rd.delete(BOARD_RANK_KEY)
+    return total
+
+
+async def ensure_board_rank(rd: Redis):
+    '''
+    게시판 순위가 없는 경우 (redis 초기화 등) DB로부터 재생성
+    '''
+    if not await rd.exists(BOARD_RANK_KEY):
+        async with SessionLocal() as db:
+            await rebuild_board_rank(rd, db)
+
+
+async def main():
+    init_redis()
+    try:
+        async with SessionLocal() as db:
+            total = await rebuild_board_rank(await get_redis(), db)
+        print(f"게시판 순위를 재생성했습니다. ({total}개)")
+    finally:
+        await close_redis()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
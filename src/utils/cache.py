@@ -0,0 +1,208 @@
+import asyncio
+import json
+import secrets
+import time
+
+from fastapi import HTTPException, status
+from redis.asyncio import Redis
+
+from src.core.models import Board, Post
+from src.utils.config import get_settings
+from src.utils.db_utils import get_row_values
+from src.utils.single_flight import single_flight
+
+
+def _cache_key(kind: str, obj_id: int):
+    return f"cache:{kind}:{obj_id}"
+
+
+def _version_key(kind: str, obj_id: int):
+    return f"ver:{kind}:{obj_id}"
+
+
+# lock을 얻은 worker의 token과 일치하는 경우에만 삭제 (GET + DEL을 원자적으로 실행)
+_RELEASE_LOCK = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+
+def _version_seed():
+    '''
+    version 초기값, redis가 초기화되어도 이전에 발급한 version(ETag)과 겹치지 않도록 현재 시각(μs) 사용
+    '''
+    return time.time_ns() // 1000
+
+
+async def get_versions(rd: Redis, *targets: tuple):
+    '''
+    version 조회 함수
+
+        Arguments:
+            rd (Redis): Redis 연결
+            targets: (종류, ID) 목록
+
+        Returns:
+            각 대상의 현재 version 목록, 없는 경우 초기값을 저장한 후 반환
+    '''
+    keys = [_version_key(kind, obj_id) for kind, obj_id in targets]
+    versions = await rd.mget(keys)
+    for i, version in enumerate(versions):
+        if version is None:
+            await rd.set(keys[i], _version_seed(), nx=True)
+            version = await rd.get(keys[i])
+        versions[i] = int(version)
+    return versions
+
+
+async def read_through(rd: Redis, kind: str, obj_id: int, loader):
+    '''
+    read-through 캐시 조회 함수
+
+    현재 version과 캐시를 한 번에 조회하여 캐시의 version이 같으면 캐시를 반환하고,
+    다르거나 없으면 loader로 조회한 값을 현재 version과 함께 CACHE_TTL_SECONDS 동안 캐시
+    같은 객체의 캐시 미스가 동시에 발생하면 하나의 loader 결과를 공유 (single-flight)
+    loader 조회 전에 version을 읽으므로 조회 중에 수정된 경우 이전 version으로 저장되어 다음 조회에서 무효화됨
+
+        Arguments:
+            rd (Redis): Redis 연결
+            kind (str): 캐시 종류 (post, board)
+            obj_id (int): 객체 ID
+            loader: 캐시가 없을 때 version을 인자로 받아 dict를 반환하는 async 함수
+
+        Returns:
+            data (dict): 캐시 또는 loader가 반환한 dict
+            version (int): data의 version
+    '''
+    version, cached = await rd.mget(_version_key(kind, obj_id), _cache_key(kind, obj_id))
+    if version is None:
+        version, = await get_versions(rd, (kind, obj_id))
+    version = int(version)
+    data = _cached_data(cached, version)
+    if data is None:
+        data = await single_flight.do((kind, obj_id, version), lambda: _fill(rd, kind, obj_id, version, loader))
+    return data, version
+
+
+def _cached_data(cached, version: int):
+    if cached:
+        entry = json.loads(cached)
+        if entry["v"] == version:
+            return entry["data"]
+    return None
+
+
+async def _fill(rd: Redis, kind: str, obj_id: int, version: int, loader):
+    '''
+    캐시 미스 처리 함수
+
+    SINGLE_FLIGHT_LOCK_MS가 설정된 경우 redis lock으로 여러 worker 중 하나만 DB를 조회하고,
+    lock을 얻지 못한 worker는 lock 유지 기간 동안 캐시가 채워지기를 기다린 후 채워지지 않으면 직접 조회
+    lock은 얻은 worker만 자신의 token으로 해제하므로, 직접 조회한 worker가 다른 worker의 lock을 삭제하지 않음
+    '''
+    key = _cache_key(kind, obj_id)
+    lock_ms = get_settings().SINGLE_FLIGHT_LOCK_MS
+    lock_key = f"lock:{key}:{version}"
+    token = None
+    if lock_ms:
+        token = secrets.token_hex(16)
+        if not await rd.set(lock_key, token, nx=True, px=lock_ms):
+            token = None
+            deadline = time.monotonic() + lock_ms / 1000
+            while time.monotonic() < deadline:
+                await asyncio.sleep(0.01)
+                data = _cached_data(await rd.get(key), version)
+                if data is not None:
+                    return data
+    try:
+        data = await loader(version)
+        await rd.set(key, json.dumps({"v": version, "data": data}), ex=get_settings().CACHE_TTL_SECONDS)
+    finally:
+        if token is not None:
+            await rd.eval(_RELEASE_LOCK, 1, lock_key, token)
+    return data
+
+
+async def bump_version(rd: Redis, kind: str, *obj_ids: int):
+    '''
+    캐시 무효화 함수
+
+    객체의 version을 증가시켜 이전 version으로 저장된 캐시가 더 이상 사용되지 않도록 함
+    DB commit 이후에 호출해야 함
+    '''
+    await bump_versions(rd, *((kind, obj_id) for obj_id in obj_ids))
+
+
+async def bump_versions(rd: Redis, *targets: tuple):
+    '''
+    여러 종류의 version을 한 번에 증가시키는 함수
+
+        Arguments:
+            rd (Redis): Redis 연결
+            targets: (종류, ID) 목록
+    '''
+    if not targets:
+        return
+    pipe = rd.pipeline(transaction=False)
+    add_version_bumps(pipe, *targets)
+    await pipe.execute()
+
+
+def add_version_bumps(pipe, *targets: tuple):
+    '''
+    pipeline에 version 증가 명령을 추가하는 함수, 다른 명령과 하나의 transaction으로 실행할 때 사용
+
+        Arguments:
+            pipe: Redis pipeline
+            targets: (종류, ID) 목록
+    '''
+    for kind, obj_id in targets:
+        key = _version_key(kind, obj_id)
+        pipe.set(key, _version_seed(), nx=True)
+        pipe.incr(key)
+
+
+async def get_cached_board(board_id: int, rd: Redis):
+    '''
+    게시판 캐시 조회 함수
+
+    캐시된 게시판 정보로 생성한 (세션에 속하지 않은) 게시판 객체를 반환
+
+        Raises:
+            HTTP_404_NOT_FOUND: 해당하는 게시판이 존재하지 않는 경우
+
+        Returns:
+            board (Board): 게시판 객체
+            version (int): 게시판 version
+    '''
+    async def load(version):
+        data = await get_row_values(Board, board_id, version)
+        if data is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="게시판을 찾을 수 없습니다.")
+        return data
+    data, version = await read_through(rd, "board", board_id, load)
+    return Board(**data), version
+
+
+async def get_cached_post(post_id: int, rd: Redis):
+    '''
+    게시글 캐시 조회 함수
+
+    캐시된 게시글 정보로 생성한 (세션에 속하지 않은) 게시글 객체를 반환, 상세 조회용이므로 content 포함
+
+        Raises:
+            HTTP_404_NOT_FOUND: 해당하는 게시글이 존재하지 않는 경우
+
+        Returns:
+            post (Post): 게시글 객체
+            version (int): 게시글 version
+    '''
+    async def load(version):
+        data = await get_row_values(Post, post_id, version, with_deferred=True)
+        if data is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="게시글을 찾을 수 없습니다.")
+        return data
+    data, version = await read_through(rd, "post", post_id, load)
+    return Post(**data), version
@@ -1,3 +1,6 @@
+from functools import lru_cache
+from typing import Literal
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -8,16 +11,92 @@ class Settings(BaseSettings):
         Attributes:
             ACCESS_TOKEN_EXPIRE_SECONDS (int): 로그인 세션 유지 기간 (redis 만료)
             SQLALCHEMY_DATABASE_URL (str): PostgreSQL DB 연결 주소
+            DB_POOL_SIZE (int): DB connection pool 기본 연결 수
+            DB_MAX_OVERFLOW (int): pool_size를 초과하여 추가로 생성할 수 있는 연결 수
+            DB_POOL_TIMEOUT (float): pool에 남은 연결이 없을 때 대기하는 최대 시간 (초)
+            DB_POOL_PRE_PING (bool): 연결을 가져올 때 연결 상태 확인 여부
+            DB_POOL_RECYCLE (int): 연결을 재생성하는 주기 (초)
+            BCRYPT_ROUNDS (int): 비밀번호 bcrypt hash cost factor
+            PASSWORD_WORKERS (int): 비밀번호 hash 전용 process 수 (0이면 CPU 코어 수)
+            PASSWORD_QUEUE_LIMIT (int): 대기할 수 있는 비밀번호 hash 연산 수, 초과 시 503 반환
+                (hash 대기 중인 요청은 DB 연결을 점유하지 않으므로 DB pool 크기보다 크게 설정 가능)
+            CACHE_TTL_SECONDS (int): 게시글, 게시판 조회 캐시 유지 기간 (초)
+            SINGLE_FLIGHT_LOCK_MS (int): 캐시 미스 시 worker 간 중복 조회를 막는 redis lock 유지 기간 (ms, 0이면 사용하지 않음)
+            COUNTER_FLUSH_INTERVAL_MS (int): redis에 누적된 게시글 수, 조회수 변경량을 DB에 반영하는 주기 (ms)
+            COUNTER_FLUSH_LEASE_MS (int): flush 처리 기한 (ms), 기한이 지나도 완료되지 않은 변경량은 worker가 종료된 것으로 보고 다시 반영
+                (DB_POOL_TIMEOUT과 batch UPDATE 시간보다 길게 설정)
+            VIEW_UNIQUE_VIEWERS (bool): 게시글 순 조회자 수(HyperLogLog) 기록 여부
+            TOKEN_CACHE_SIZE (int): 프로세스별 access token 캐시 최대 크기
+            TOKEN_CACHE_TTL_SECONDS (float): access token 캐시 유지 기간 (초)
             PAGE_SIZE (str): pagination 단위
+            BOARD_COUNT_CACHE_SECONDS (int): 접근 가능한 게시판 수 캐시 유지 기간 (redis 만료)
+            FEED_CAP (int): 게시판별, 공개 feed에 유지하는 최신 게시글 수
+            BATCH_MAX_IDS (int): 게시글, 게시판 일괄 조회 시 한 번에 요청할 수 있는 최대 ID 수
+            IMPORT_BATCH_SIZE (int): 게시글 일괄 등록 시 한 번에 INSERT하는 게시글 수
+            IMPORT_MAX_ERRORS (int): 게시글 일괄 등록 응답에 포함할 최대 오류 수
+            PROFILE_ENABLED (bool): 앱 실행 시 요청 profiling 사용 여부 (실행 중 /monitor/profiler에서 변경 가능)
+            PROFILE_SAMPLE_RATE (float): profiling 결과를 저장할 요청 비율 (0 ~ 1)
+            PROFILE_SLOW_MS (float): 처리 시간이 이 값 이상인 요청의 profiling 결과 저장 (ms, 0이면 사용하지 않음)
+            PROFILE_INTERVAL_MS (float): profiler sampling 간격 (ms)
+            PROFILE_BUFFER_SIZE (int): worker별로 보관하는 최근 profiling 결과 수
+            MONITOR_TOKEN (str): /monitor endpoint 접근 token (X-Monitor-Token header, 비어 있으면 접근 불가)
+            QUERY_BUDGET_MODE (str): route별 SQL 실행 수 제한 초과, N+1 감지 시 처리 방식 (metric, log, raise)
             REDIS_HOST (str): Redis host 이름
             REDIS_PORT (int): Redis 연결 포트
             REDIS_DATABASE (int): Redis 데이터베이스
+            REDIS_MAX_CONNECTIONS (int): Redis connection pool 최대 연결 수
+            REDIS_POOL_TIMEOUT (float): pool에 남은 연결이 없을 때 대기하는 최대 시간 (초)
+            REDIS_SOCKET_TIMEOUT (float): Redis 명령 응답 대기 시간 (초)
+            REDIS_SOCKET_CONNECT_TIMEOUT (float): Redis 연결 대기 시간 (초)
+            REDIS_HEALTH_CHECK_INTERVAL (int): 유휴 연결 health check 주기 (초)
     '''
     ACCESS_TOKEN_EXPIRE_SECONDS: int = 0
     SQLALCHEMY_DATABASE_URL: str = ""
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_PRE_PING: bool = True
+    DB_POOL_RECYCLE: int = 1800
+    BCRYPT_ROUNDS: int = 12
+    PASSWORD_WORKERS: int = 0
+    PASSWORD_QUEUE_LIMIT: int = 64
+    CACHE_TTL_SECONDS: int = 300
+    SINGLE_FLIGHT_LOCK_MS: int = 0
+    COUNTER_FLUSH_INTERVAL_MS: int = 1000
+    COUNTER_FLUSH_LEASE_MS: int = 60000
+    VIEW_UNIQUE_VIEWERS: bool = True
+    TOKEN_CACHE_SIZE: int = 10000
+    TOKEN_CACHE_TTL_SECONDS: float = 30.0
     PAGE_SIZE: int = 1
+    BOARD_COUNT_CACHE_SECONDS: int = 10
+    FEED_CAP: int = 1000
+    BATCH_MAX_IDS: int = 100
+    IMPORT_BATCH_SIZE: int = 1000
+    IMPORT_MAX_ERRORS: int = 100
+    PROFILE_ENABLED: bool = False
+    PROFILE_SAMPLE_RATE: float = 0.0
+    PROFILE_SLOW_MS: float = 1000.0
+    PROFILE_INTERVAL_MS: float = 1.0
+    PROFILE_BUFFER_SIZE: int = 50
+    MONITOR_TOKEN: str = ""
+    QUERY_BUDGET_MODE: Literal["metric", "log", "raise"] = "metric"
     REDIS_HOST: str = ""
     REDIS_PORT: int = 0
     REDIS_DATABASE: int = 0
+    REDIS_MAX_CONNECTIONS: int = 50
+    REDIS_POOL_TIMEOUT: float = 5.0
+    REDIS_SOCKET_TIMEOUT: float = 5.0
+    REDIS_SOCKET_CONNECT_TIMEOUT: float = 5.0
+    REDIS_HEALTH_CHECK_INTERVAL: int = 30
+
+    model_config = SettingsConfigDict(env_file=".env")
+
 
-    model_config = SettingsConfigDict(env_file=".env")
\ No newline at end of file
+@lru_cache
+def get_settings():
+    '''
+    Settings 조회 함수
+
+    .env 파일은 최초 호출 시 한 번만 읽고, 이후에는 같은 Settings 객체를 반환
+    '''
+    return Settings()
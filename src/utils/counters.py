@@ -0,0 +1,352 @@
+import asyncio
+import logging
+import time
+import uuid
+
+from redis.asyncio import Redis
+from sqlalchemy import select, update, bindparam
+
+from src.core.db_config import SessionLocal
+from src.core.models import Board, Post
+from src.utils.config import get_settings
+from src.utils.cache import add_version_bumps
+
+logger = logging.getLogger(__name__)
+
+POST_COUNT_DELTA_KEY = "board:post_count:delta"
+VIEW_COUNT_DELTA_KEY = "post:view_count:delta"
+
+
+def _board_views_key(board_id: int):
+    return f"board:views:{board_id}"
+
+
+def _post_viewers_key(post_id: int):
+    return f"post:viewers:{post_id}"
+
+
+def _inflight_key(key: str):
+    return f"{key}:flushing"
+
+
+# 누적 hash가 있는 경우에만 처리 중 hash로 rename하고 처리 중 목록(ZSET, score는 처리 기한)에 추가
+_DRAIN = """
+if redis.call("exists", KEYS[1]) == 0 then
+    return 0
+end
+redis.call("rename", KEYS[1], KEYS[2])
+redis.call("zadd", KEYS[3], ARGV[1], KEYS[2])
+return 1
+"""
+
+# 처리 중 hash의 변경량을 누적 hash에 더한 후 처리 중 hash와 목록에서 삭제
+# 같은 hash를 여러 worker가 동시에 복구해도 한 번만 더해짐
+_RESTORE = """
+local entries = redis.call("hgetall", KEYS[1])
+for i = 1, #entries, 2 do
+    redis.call("hincrby", KEYS[2], entries[i], entries[i + 1])
+end
+redis.call("del", KEYS[1])
+redis.call("zrem", KEYS[3], KEYS[1])
+return #entries / 2
+"""
+
+# 누적 hash와 처리 중 hash들의 ID(ARGV)별 변경량 합계
+_PENDING = """
+local hashes = redis.call("zrange", KEYS[2], 0, -1)
+table.insert(hashes, 1, KEYS[1])
+local totals = {}
+for i = 1, #ARGV do
+    totals[i] = 0
+end
+for _, hash in ipairs(hashes) do
+    local values = redis.call("hmget", hash, unpack(ARGV))
+    for i = 1, #ARGV do
+        if values[i] then
+            totals[i] = totals[i] + tonumber(values[i])
+        end
+    end
+end
+return totals
+"""
+
+
+async def incr_post_count(rd: Redis, board_id: int, delta: int):
+    '''
+    게시글 수 변경 함수
+
+    board row를 직접 수정하지 않고 redis에 변경량을 누적, 누적된 값은 flush_post_counts에서 DB에 반영
+    '''
+    await rd.hincrby(POST_COUNT_DELTA_KEY, board_id, delta)
+
+
+async def pending_post_count(rd: Redis, board_id: int):
+    '''
+    아직 DB에 반영되지 않은 게시글 수 변경량 조회 함수 (flush 중인 변경량 포함)
+    '''
+    return (await pending_post_counts(rd, [board_id]))[0]
+
+
+async def pending_post_counts(rd: Redis, board_ids: list):
+    '''
+    여러 게시판의 아직 DB에 반영되지 않은 게시글 수 변경량 조회 함수 (flush 중인 변경량 포함)
+
+        Returns:
+            board_ids 순서의 변경량 목록
+    '''
+    if not board_ids:
+        return []
+    return [int(v) for v in await rd.eval(_PENDING, 2, POST_COUNT_DELTA_KEY, _inflight_key(POST_COUNT_DELTA_KEY), *board_ids)]
+
+
+async def discard_post_count(rd: Redis, board_id: int):
+    '''
+    삭제된 게시판의 게시글 수 변경량 삭제 함수
+    '''
+    await rd.hdel(POST_COUNT_DELTA_KEY, board_id)
+
+
+def _now_ms():
+    return int(time.time() * 1000)
+
+
+async def pending_deltas(rd: Redis, key: str):
+    '''
+    아직 DB에 반영되지 않은 전체 변경량 조회 함수 (flush 중인 변경량 포함)
+
+        Returns:
+            {id: 변경량}
+    '''
+    hashes = [key, *await rd.zrange(_inflight_key(key), 0, -1)]
+    pipe = rd.pipeline(transaction=False)
+    for name in hashes:
+        pipe.hgetall(name)
+    totals = {}
+    for deltas in await pipe.execute():
+        for k, v in deltas.items():
+            totals[int(k)] = totals.get(int(k), 0) + int(v)
+    return totals
+
+
+async def recover_deltas(rd: Redis, key: str):
+    '''
+    완료되지 않은 flush 변경량 복구 함수
+
+    처리 기한(COUNTER_FLUSH_LEASE_MS)이 지나도록 완료되지 않은 처리 중 hash는 flush하던 worker가 종료된 것으로 보고
+    누적 hash에 되돌려 다음 flush에서 반영
+
+        Returns:
+            복구한 처리 중 hash 수
+    '''
+    inflight = _inflight_key(key)
+    expired = await rd.zrangebyscore(inflight, "-inf", _now_ms())
+    for processing in expired:
+        await rd.eval(_RESTORE, 3, processing, key, inflight)
+    if expired:
+        logger.warning("완료되지 않은 flush 변경량 %d건을 복구했습니다. (%s)", len(expired), key)
+    return len(expired)
+
+
+async def drain_deltas(rd: Redis, key: str):
+    '''
+    누적 변경량 회수 함수
+
+    기한이 지난 처리 중 hash를 먼저 복구한 후, 누적 hash를 고유한 이름으로 rename하여 다른 worker나 새로운 변경과 겹치지 않게 회수
+    회수한 hash는 처리 기한과 함께 처리 중 목록에 기록되어 완료 전까지 pending 조회에 포함됨
+
+        Returns:
+            processing (str): 회수한 hash의 key, 회수할 값이 없는 경우 None
+            deltas (dict): {id: 변경량}
+    '''
+    await recover_deltas(rd, key)
+    processing = f"{key}:flushing:{uuid.uuid4().hex}"
+    deadline = _now_ms() + get_settings().COUNTER_FLUSH_LEASE_MS
+    if not await rd.eval(_DRAIN, 3, key, processing, _inflight_key(key), deadline):
+        return None, {}
+    deltas = await rd.hgetall(processing)
+    return processing, {int(k): int(v) for k, v in deltas.items() if int(v)}
+
+
+async def restore_deltas(rd: Redis, key: str, processing: str):
+    '''
+    DB 반영에 실패한 처리 중 hash의 변경량을 누적 hash에 되돌리는 함수
+    '''
+    await rd.eval(_RESTORE, 3, processing, key, _inflight_key(key))
+
+
+async def complete_deltas(rd: Redis, key: str, processing: str, *version_targets: tuple):
+    '''
+    DB 반영이 끝난 처리 중 hash 삭제 함수
+
+    처리 중 목록 삭제와 version 증가(캐시 무효화)를 하나의 transaction으로 실행하여
+    pending 조회에서 변경량이 빠지는 시점과 캐시가 DB 값으로 갱신되는 시점이 어긋나지 않도록 함
+
+        Arguments:
+            rd (Redis): Redis 연결
+            key (str): 누적 hash key
+            processing (str): 처리 중 hash key
+            version_targets: 증가시킬 version의 (종류, ID) 목록
+    '''
+    pipe = rd.pipeline(transaction=True)
+    pipe.delete(processing)
+    pipe.zrem(_inflight_key(key), processing)
+    add_version_bumps(pipe, *version_targets)
+    await pipe.execute()
+
+
+async def flush_post_counts(rd: Redis):
+    '''
+    게시글 수 flush 함수
+
+    누적된 게시판별 게시글 수 변경량을 하나의 batch UPDATE로 board.post_count에 반영하고 해당 게시판 캐시를 무효화
+    DB 반영에 실패한 경우에만 변경량을 되돌리고, commit 이후의 완료 기록과 캐시 무효화는 실패해도 변경량을 되돌리지 않음
+    flush 중 worker가 종료되어 완료되지 않은 변경량은 처리 기한이 지난 후 다음 flush에서 복구하여 반영
+
+        Returns:
+            반영한 게시판 ID 목록
+    '''
+    processing, deltas = await drain_deltas(rd, POST_COUNT_DELTA_KEY)
+    if processing is None:
+        return []
+    try:
+        if deltas:
+            board = Board.__table__
+            stmt = (update(board)
+                    .where(board.c.id == bindparam("b_id"))
+                    .values(post_count=board.c.post_count + bindparam("delta")))
+            async with SessionLocal() as db:
+                await db.execute(stmt, [{"b_id": k, "delta": v} for k, v in deltas.items()])
+                await db.commit()
+    except Exception:
+        await restore_deltas(rd, POST_COUNT_DELTA_KEY, processing)
+        raise
+    # commit 이후에는 변경량을 되돌리면 다음 flush에서 중복 반영되므로 완료 기록 실패는 기록만 함
+    targets = [("board", board_id) for board_id in deltas]
+    if targets:
+        targets.append(("board_list", 0))
+    try:
+        await complete_deltas(rd, POST_COUNT_DELTA_KEY, processing, *targets)
+    except Exception:
+        logger.warning("게시글 수 반영 후 완료 기록과 캐시 무효화에 실패했습니다.", exc_info=True)
+    return list(deltas)
+
+
+async def record_view(rd: Redis, board_id: int, post_id: int, user_id: int):
+    '''
+    게시글 조회 기록 함수
+
+    DB를 수정하지 않고 redis에 조회수 변경량, 게시판별 조회수 순위, 순 조회자(HyperLogLog)를 한 번에 기록
+    누적된 조회수 변경량은 flush_view_counts에서 DB에 반영
+    '''
+    pipe = rd.pipeline(transaction=False)
+    pipe.hincrby(VIEW_COUNT_DELTA_KEY, post_id, 1)
+    pipe.zincrby(_board_views_key(board_id), 1, post_id)
+    if get_settings().VIEW_UNIQUE_VIEWERS:
+        pipe.pfadd(_post_viewers_key(post_id), user_id)
+    await pipe.execute()
+
+
+async def discard_views(rd: Redis, board_id: int, post_id: int):
+    '''
+    삭제된 게시글의 조회 기록 삭제 함수
+    '''
+    pipe = rd.pipeline(transaction=False)
+    pipe.hdel(VIEW_COUNT_DELTA_KEY, post_id)
+    pipe.zrem(_board_views_key(board_id), post_id)
+    pipe.delete(_post_viewers_key(post_id))
+    await pipe.execute()
+
+
+async def discard_board_views(rd: Redis, board_id: int):
+    '''
+    삭제된 게시판의 조회수 순위 삭제 함수
+    '''
+    await rd.delete(_board_views_key(board_id))
+
+
+async def most_viewed(rd: Redis, board_id: int, limit: int):
+    '''
+    게시판 조회수 순위 조회 함수
+
+    DB를 조회하지 않고 redis의 게시판별 조회수 순위와 순 조회자 수만으로 조회수가 많은 게시글을 반환
+
+        Returns:
+            [{"post_id", "view_count", "viewers"}] 목록 (조회수 역순)
+    '''
+    ranked = await rd.zrevrange(_board_views_key(board_id), 0, limit - 1, withscores=True)
+    viewers = [None] * len(ranked)
+    if ranked and get_settings().VIEW_UNIQUE_VIEWERS:
+        pipe = rd.pipeline(transaction=False)
+        for post_id, _ in ranked:
+            pipe.pfcount(_post_viewers_key(int(post_id)))
+        viewers = await pipe.execute()
+    return [{"post_id": int(post_id), "view_count": int(score), "viewers": count}
+            for (post_id, score), count in zip(ranked, viewers)]
+
+
+async def flush_view_counts(rd: Redis):
+    '''
+    조회수 flush 함수
+
+    누적된 게시글별 조회수 변경량을 하나의 batch UPDATE로 post.view_count에 반영
+    redis 초기화 등으로 게시판별 조회수 순위가 DB보다 작으면 DB 조회수로 복구 (ZADD GT)
+    DB 반영에 실패한 경우에만 변경량을 되돌리고, commit 이후의 완료 기록과 순위 복구는 실패해도 변경량을 되돌리지 않음
+    flush 중 worker가 종료되어 완료되지 않은 변경량은 처리 기한이 지난 후 다음 flush에서 복구하여 반영
+
+        Returns:
+            반영한 게시글 ID 목록
+    '''
+    processing, deltas = await drain_deltas(rd, VIEW_COUNT_DELTA_KEY)
+    if processing is None:
+        return []
+    post = Post.__table__
+    try:
+        if deltas:
+            stmt = (update(post)
+                    .where(post.c.id == bindparam("p_id"))
+                    .values(view_count=post.c.view_count + bindparam("delta")))
+            async with SessionLocal() as db:
+                await db.execute(stmt, [{"p_id": k, "delta": v} for k, v in deltas.items()])
+                await db.commit()
+    except Exception:
+        await restore_deltas(rd, VIEW_COUNT_DELTA_KEY, processing)
+        raise
+    # commit 이후에는 변경량을 되돌리면 다음 flush에서 중복 반영되므로 완료 기록, 순위 복구 실패는 기록만 함
+    try:
+        await complete_deltas(rd, VIEW_COUNT_DELTA_KEY, processing)
+    except Exception:
+        logger.warning("조회수 반영 후 완료 기록에 실패했습니다.", exc_info=True)
+    if deltas:
+        try:
+            async with SessionLocal() as db:
+                rows = (await db.execute(select(post.c.id, post.c.board_id, post.c.view_count)
+                                         .where(post.c.id.in_(list(deltas))))).all()
+            pipe = rd.pipeline(transaction=False)
+            for post_id, board_id, view_count in rows:
+                pipe.zadd(_board_views_key(board_id), {post_id: view_count}, gt=True)
+            await pipe.execute()
+        except Exception:
+            logger.warning("조회수 반영 후 조회수 순위 복구에 실패했습니다.", exc_info=True)
+    return list(deltas)
+
+
+async def run_counter_flusher(rd: Redis):
+    '''
+    counter flush background 작업
+
+    COUNTER_FLUSH_INTERVAL_MS 마다 누적된 게시글 수, 조회수 변경량을 DB에 반영, 종료 시 남은 변경량을 한 번 더 반영
+    '''
+    interval = get_settings().COUNTER_FLUSH_INTERVAL_MS / 1000
+    flushers = ((flush_post_counts, "게시글 수"), (flush_view_counts, "조회수"))
+    try:
+        while True:
+            await asyncio.sleep(interval)
+            for flush, name in flushers:
+                try:
+                    await flush(rd)
+                except Exception:
+                    logger.warning(f"{name} flush에 실패했습니다.", exc_info=True)
+    except asyncio.CancelledError:
+        for flush, _ in flushers:
+            await flush(rd)
+        raise
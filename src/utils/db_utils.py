@@ -1,9 +1,49 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import select, insert, inspect
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer
 from fastapi import HTTPException, status
 
+from src.core.db_config import SessionLocal
 from src.core.models import User, Board, Post
+from src.utils.single_flight import single_flight
 
-def get_user_from_db(user_email: str, db: Session):
+# INSERT ... ON CONFLICT DO NOTHING RETURNING을 지원하는 dialect별 insert
+_ON_CONFLICT_INSERTS = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+async def get_row_values(model, obj_id: int, version: int, with_deferred: bool = False):
+    '''
+    캐시 채우기용 primary key 조회 함수
+
+    같은 version의 같은 객체를 동시에 조회하는 요청은 하나의 쿼리 결과(column 값)를 공유 (single-flight)
+    key에 version이 포함되므로 수정 후(version 증가) 시작된 조회는 수정 전에 시작된 조회의 결과를 공유하지 않음
+    결과를 다른 요청과 공유하므로 수정에 사용할 객체는 get_board_from_db, get_post_from_db로 조회해야 함
+    먼저 호출한 요청이 취소되어도 다른 요청이 결과를 받을 수 있도록 요청 세션이 아닌 별도 세션에서 조회
+
+        Arguements:
+            model: 조회할 객체의 Model
+            obj_id (int): 객체 ID
+            version (int): 캐시 version
+            with_deferred (bool): deferred column 조회 여부
+
+        Returns:
+            column 값 dict, 존재하지 않는 경우 None
+    '''
+    table = model.__table__
+    columns = [prop.columns[0] for prop in inspect(model).column_attrs if with_deferred or not prop.deferred]
+
+    async def load():
+        async with SessionLocal() as db:
+            row = (await db.execute(select(*columns).where(table.c.id == obj_id))).mappings().first()
+        return dict(row) if row else None
+
+    return await single_flight.do((table.name, obj_id, with_deferred, version), load)
+
+async def get_user_from_db(user_email: str, db: AsyncSession):
     '''
     유저 검색 함수
 
@@ -11,7 +51,7 @@ def get_user_from_db(user_email: str, db: Session):
 
         Arguements:
             user_email (str): 유저의 이메일
-            db (Session): DB 세션
+            db (AsyncSession): DB 세션
 
         Raises:
             HTTP_401_UNAUTHORIZED: 이메일이 일치하는 계정이 없는 경우
@@ -19,20 +59,21 @@ def get_user_from_db(user_email: str, db: Session):
         Returns:
             유저 객체
     '''
-    user = db.query(User).filter(User.email==user_email).first()
+    user = await db.scalar(select(User).filter(User.email==user_email))
     if not user:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail='해당 이메일의 계정이 존재하지 않습니다.')
     return user
 
-def get_board_from_db(board_id: int, db: Session):
+async def get_board_from_db(board_id: int, db: AsyncSession):
     '''
     게시판 검색 함수
 
     게시판 id를 입력받아 DB에서 일치하는 게시판 객체를 반환
+    다른 요청과 결과를 공유하지 않고 현재 세션에서 직접 조회하므로 수정에 사용 가능
 
         Arguements:
             board_id (int): 게시판 ID
-            db (Session): DB 세션
+            db (AsyncSession): DB 세션
 
         Raises:
             HTTP_404_NOT_FOUND: 해당하는 게시판이 존재하지 않는 경우
@@ -40,20 +81,22 @@ def get_board_from_db(board_id: int, db: Session):
         Returns:
             게시판 객체
     '''
-    board = db.query(Board).get(board_id)
+    board = await db.get(Board, board_id)
     if not board:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="게시판을 찾을 수 없습니다.")
     return board
 
-def get_post_from_db(post_id: int, db: Session):
+async def get_post_from_db(post_id: int, db: AsyncSession, with_content: bool = False):
     '''
     게시글 검색 함수
 
     게시글 id를 입력받아 DB에서 일치하는 게시판 객체를 반환
+    다른 요청과 결과를 공유하지 않고 현재 세션에서 직접 조회하므로 수정에 사용 가능
 
         Arguements:
             post_id (int): 게시글 ID
-            db (Session): DB 세션
+            db (AsyncSession): DB 세션
+            with_content (bool): 게시글 내용(deferred column) 조회 여부
 
         Raises:
             HTTP_404_NOT_FOUND: 해당하는 게시글이 존재하지 않는 경우
@@ -61,7 +104,40 @@ def get_post_from_db(post_id: int, db: Session):
         Returns:
             게시글 객체
     '''
-    post = db.query(Post).get(post_id)
+    post = await db.get(Post, post_id, options=[undefer(Post.content)] if with_content else None)
     if not post:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="게시글을 찾을 수 없습니다.")
-    return post
\ No newline at end of file
+    return post
+
+async def insert_unique(model, values: dict, unique_column, db: AsyncSession):
+    '''
+    unique column 충돌 확인 INSERT 함수
+
+    중복 확인 SELECT 없이 INSERT 한 번으로 객체를 생성하고 unique column 충돌 여부를 반환
+    PostgreSQL, SQLite는 INSERT ... ON CONFLICT DO NOTHING RETURNING으로 충돌 시 row를 반환하지 않고,
+    그 외 DB는 unique 위반을 잡아 rollback 후 같은 값이 실제로 존재하는 경우에만 충돌로 판단
+    unique column 충돌 외의 오류는 그대로 발생
+
+        Arguements:
+            model: 생성할 객체의 Model
+            values (dict): 생성할 객체의 column 값
+            unique_column: 충돌을 확인할 unique column
+            db (AsyncSession): DB 세션
+
+        Returns:
+            생성된 객체 ID, 같은 값이 이미 존재하는 경우 None
+    '''
+    dialect_insert = _ON_CONFLICT_INSERTS.get(db.get_bind().dialect.name)
+    if dialect_insert is not None:
+        statement = (dialect_insert(model).values(**values)
+                     .on_conflict_do_nothing(index_elements=[unique_column])
+                     .returning(model.id))
+        return await db.scalar(statement)
+    try:
+        result = await db.execute(insert(model).values(**values))
+    except IntegrityError:
+        await db.rollback()
+        if await db.scalar(select(model.id).where(unique_column == values[unique_column.key])) is None:
+            raise
+        return None
+    return result.inserted_primary_key[0]
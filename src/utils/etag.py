@@ -0,0 +1,37 @@
+import hashlib
+
+from fastapi import Response, status
+
+
+def make_etag(*parts):
+    '''
+    ETag 생성 함수
+
+    resource를 구분하는 값과 version 값들로 strong ETag를 생성
+
+        Arguments:
+            parts: resource 종류, ID, version 등 응답 내용을 결정하는 값들
+
+        Returns:
+            따옴표로 감싼 ETag 문자열
+    '''
+    raw = "|".join(str(part) for part in parts).encode()
+    return f'"{hashlib.blake2b(raw, digest_size=16).hexdigest()}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str):
+    '''
+    If-None-Match header가 ETag와 일치하는지 확인 (weak comparison)
+    '''
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+
+def not_modified(etag: str):
+    '''
+    304 Not Modified 응답 생성 함수
+    '''
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
@@ -0,0 +1,73 @@
+import asyncio
+import re
+
+from sqlalchemy import select, update, bindparam
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.db_config import SessionLocal
+from src.core.models import Post
+
+EXCERPT_LENGTH = 200
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def make_excerpt(content: str, length: int = EXCERPT_LENGTH):
+    '''
+    게시글 요약 생성 함수
+
+    게시글 내용의 연속된 공백을 하나로 합치고, length보다 긴 경우 잘라서 말줄임표를 붙임
+
+        Arguments:
+            content (str): 게시글의 내용
+            length (int): 요약의 최대 길이
+
+        Returns:
+            length 이하 길이의 게시글 요약
+    '''
+    text = _WHITESPACE.sub(" ", content).strip()
+    if len(text) <= length:
+        return text
+    return text[:length - 1].rstrip() + "…"
+
+
+async def backfill_excerpts(db: AsyncSession, batch_size: int = 1000):
+    '''
+    게시글 요약 일괄 생성 함수
+
+    요약이 비어 있는 게시글의 요약을 batch_size개씩 생성하여 DB에 반영
+
+        Returns:
+            요약을 생성한 게시글 수
+    '''
+    total = 0
+    last_id = 0
+    _update = (update(Post.__table__)
+               .where(Post.__table__.c.id == bindparam("p_id"))
+               .values(excerpt=bindparam("p_excerpt")))
+    while True:
+        rows = (await db.execute(select(Post.id, Post.content)
+                                 .filter(Post.excerpt == "", Post.id > last_id)
+                                 .order_by(Post.id).limit(batch_size))).all()
+        if not rows:
+            return total
+        params = []
+        for i, content in rows:
+            excerpt = make_excerpt(content)
+            if excerpt:
+                params.append({"p_id": i, "p_excerpt": excerpt})
+        if params:
+            await db.execute(_update, params)
+            await db.commit()
+        total += len(params)
+        last_id = rows[-1].id
+
+
+async def main():
+    async with SessionLocal() as db:
+        total = await backfill_excerpts(db)
+    print(f"게시글 요약을 생성했습니다. ({total}개)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
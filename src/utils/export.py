@@ -0,0 +1,77 @@
+import csv
+import io
+import json
+import zlib
+
+from sqlalchemy import select
+
+from src.core.db_config import SessionLocal
+from src.core.models import Post
+
+EXPORT_COLUMNS = ("id", "board_id", "user_id", "title", "content")
+EXPORT_BATCH_SIZE = 1000
+
+
+async def _post_batches(board_id: int):
+    '''
+    게시판의 게시글을 server-side cursor로 EXPORT_BATCH_SIZE개씩 조회
+
+    응답을 보내는 동안 DB 세션을 유지해야 하므로 요청 세션과 별도의 세션을 사용
+    '''
+    _query = (select(*(Post.__table__.c[name] for name in EXPORT_COLUMNS))
+              .filter(Post.board_id == board_id)
+              .order_by(Post.id)
+              .execution_options(yield_per=EXPORT_BATCH_SIZE))
+    async with SessionLocal() as db:
+        result = await db.stream(_query)
+        async for rows in result.partitions():
+            yield rows
+
+
+async def _ndjson(board_id: int):
+    async for rows in _post_batches(board_id):
+        yield "".join(json.dumps(dict(zip(EXPORT_COLUMNS, row)), ensure_ascii=False) + "\n"
+                      for row in rows).encode()
+
+
+async def _csv(board_id: int):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_COLUMNS)
+    async for rows in _post_batches(board_id):
+        writer.writerows(rows)
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+async def _gzip(chunks):
+    '''
+    stream을 gzip 형식으로 압축, 전체를 메모리에 올리지 않고 chunk 단위로 압축
+    '''
+    compressor = zlib.compressobj(wbits=31)
+    async for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def export_posts(board_id: int, export_format: str, compress: bool = False):
+    '''
+    게시판의 게시글 export 함수
+
+    게시글을 EXPORT_BATCH_SIZE개씩 조회하여 바로 변환하므로 게시판 크기와 관계없이 일정한 메모리만 사용
+
+        Arguments:
+            board_id (int): export할 게시판 ID
+            export_format (str): ndjson 또는 csv
+            compress (bool): gzip 압축 여부
+
+        Returns:
+            bytes chunk async iterator
+    '''
+    chunks = _csv(board_id) if export_format == "csv" else _ndjson(board_id)
+    return _gzip(chunks) if compress else chunks
@@ -0,0 +1,172 @@
+import asyncio
+import heapq
+import uuid
+
+from redis.asyncio import Redis
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.db_config import SessionLocal
+from src.core.models import Board, Post
+from src.core.redis_config import init_redis, close_redis, get_redis
+from src.utils.config import get_settings
+
+PUBLIC_FEED_KEY = "feed:public"
+
+
+def _board_feed_key(board_id: int):
+    return f"feed:board:{board_id}"
+
+
+async def feed_add(rd: Redis, board_id: int, public: bool, *post_ids: int):
+    '''
+    새 게시글을 게시판 feed에 추가, 공개 게시판이면 공개 feed에도 추가
+
+    각 feed(ZSET, score는 게시글 ID)는 최신 FEED_CAP개만 유지
+    '''
+    if not post_ids:
+        return
+    cap = get_settings().FEED_CAP
+    members = {post_id: post_id for post_id in post_ids}
+    keys = [_board_feed_key(board_id)] + ([PUBLIC_FEED_KEY] if public else [])
+    pipe = rd.pipeline(transaction=False)
+    for key in keys:
+        pipe.zadd(key, members)
+        pipe.zremrangebyrank(key, 0, -cap - 1)
+    await pipe.execute()
+
+
+async def feed_remove(rd: Redis, board_id: int, post_id: int):
+    '''
+    삭제된 게시글을 게시판 feed와 공개 feed에서 삭제
+    '''
+    pipe = rd.pipeline(transaction=False)
+    pipe.zrem(_board_feed_key(board_id), post_id)
+    pipe.zrem(PUBLIC_FEED_KEY, post_id)
+    await pipe.execute()
+
+
+async def feed_set_public(rd: Redis, board_id: int, public: bool):
+    '''
+    게시판 공개 여부 변경 시 게시판 feed의 게시글을 공개 feed에 병합하거나 공개 feed에서 삭제
+    '''
+    key = _board_feed_key(board_id)
+    if public:
+        await rd.zunionstore(PUBLIC_FEED_KEY, [PUBLIC_FEED_KEY, key], aggregate="MAX")
+        await rd.zremrangebyrank(PUBLIC_FEED_KEY, 0, -get_settings().FEED_CAP - 1)
+        return
+    post_ids = await rd.zrange(key, 0, -1)
+    if post_ids:
+        await rd.zrem(PUBLIC_FEED_KEY, *post_ids)
+
+
+async def feed_drop_board(rd: Redis, board_id: int):
+    '''
+    삭제된 게시판의 feed를 삭제하고, 게시판의 게시글을 공개 feed에서 삭제
+    '''
+    await feed_set_public(rd, board_id, False)
+    await rd.delete(_board_feed_key(board_id))
+
+
+async def feed_page(rd: Redis, db: AsyncSession, user_id: int, size: int, before: int | None = None):
+    '''
+    feed 조회 함수
+
+    공개 feed와 현재 유저의 비공개 게시판 feed에서 before보다 작은 게시글 ID를 size + 1개씩 조회하여
+    ID 역순으로 병합한 후, 해당 게시글만 primary key로 조회 (게시글 table을 탐색하지 않음)
+    feed는 최신 FEED_CAP개만 유지하므로 그 이전의 게시글은 조회되지 않음
+
+        Arguments:
+            rd (Redis): Redis 연결
+            db (AsyncSession): DB 세션
+            user_id (int): 현재 로그인된 유저 ID
+            size (int): 페이지 크기
+            before (int): 이전 페이지 마지막 게시글 ID, 첫 페이지는 None
+
+        Returns:
+            게시글 dict 목록 (최대 size + 1개)
+    '''
+    private = (await db.scalars(select(Board.id).filter(Board.user_id == user_id, ~Board.public))).all()
+    keys = [PUBLIC_FEED_KEY] + [_board_feed_key(board_id) for board_id in private]
+    upper = "+inf" if before is None else f"({before}"
+    pipe = rd.pipeline(transaction=False)
+    for key in keys:
+        pipe.zrevrangebyscore(key, upper, "-inf", start=0, num=size + 1)
+    merged = heapq.merge(*([int(post_id) for post_id in ids] for ids in await pipe.execute()), reverse=True)
+    post_ids = []
+    for post_id in merged:
+        if len(post_ids) > size:
+            break
+        if not post_ids or post_ids[-1] != post_id:
+            post_ids.append(post_id)
+    if not post_ids:
+        return []
+    rows = (await db.execute(select(Post.id, Post.board_id, Post.user_id, Post.title, Post.excerpt)
+                             .where(Post.id.in_(post_ids)))).mappings()
+    posts = {row["id"]: dict(row) for row in rows}
+    return [posts[post_id] for post_id in post_ids if post_id in posts]
+
+
+async def rebuild_feeds(rd: Redis, db: AsyncSession):
+    '''
+    feed 재생성 함수
+
+    DB의 게시글을 최신순으로 한 번 탐색하여 게시판별 feed와 공개 feed를 각각 최신 FEED_CAP개로 새로 만든 후 기존 feed와 교체
+
+        Returns:
+            feed를 재생성한 게시판 수
+    '''
+    cap = get_settings().FEED_CAP
+    public = set((await db.scalars(select(Board.id).filter(Board.public))).all())
+    suffix = f"rebuild:{uuid.uuid4().hex}"
+    counts = {}
+    public_count = 0
+    result = await db.stream(select(Post.id, Post.board_id).order_by(Post.id.desc()).execution_options(yield_per=1000))
+    async for rows in result.partitions():
+        pipe = rd.pipeline(transaction=False)
+        for post_id, board_id in rows:
+            if counts.get(board_id, 0) < cap:
+                counts[board_id] = counts.get(board_id, 0) + 1
+                pipe.zadd(f"{_board_feed_key(board_id)}:{suffix}", {post_id: post_id})
+            if board_id in public and public_count < cap:
+                public_count += 1
+                pipe.zadd(f"{PUBLIC_FEED_KEY}:{suffix}", {post_id: post_id})
+        await pipe.execute()
+
+    old_keys = []
+    async for key in rd.scan_iter(match=_board_feed_key("*")):
+        board_id = key.decode().split(":")[2:]
+        if len(board_id) == 1 and board_id[0].isdigit() and int(board_id[0]) not in counts:
+            old_keys.append(key)
+    if old_keys:
+        await rd.delete(*old_keys)
+    for board_id in counts:
+        await rd.rename(f"{_board_feed_key(board_id)}:{suffix}", _board_feed_key(board_id))
+    if public_count:
+        await rd.rename(f"{PUBLIC_FEED_KEY}:{suffix}", PUBLIC_FEED_KEY)
+    else:
+        await rd.delete(PUBLIC_FEED_KEY)
+    return len(counts)
+
+
+async def ensure_feeds(rd: Redis):
+    '''
+    공개 feed가 없는 경우 (redis 초기화 등) DB로부터 모든 feed 재생성
+    '''
+    if not await rd.exists(PUBLIC_FEED_KEY):
+        async with SessionLocal() as db:
+            await rebuild_feeds(rd, db)
+
+
+async def main():
+    init_redis()
+    try:
+        async with SessionLocal() as db:
+            total = await rebuild_feeds(await get_redis(), db)
+        print(f"feed를 재생성했습니다. ({total}개 게시판)")
+    finally:
+        await close_redis()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
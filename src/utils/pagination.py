@@ -0,0 +1,46 @@
+import base64
+import json
+
+from fastapi import HTTPException, status
+
+
+def encode_cursor(*values):
+    '''
+    cursor 생성 함수
+
+    keyset pagination의 마지막 정렬 key 값들을 불투명한 문자열 cursor로 변환
+
+        Arguments:
+            values: 마지막으로 반환한 객체의 정렬 key 값들
+
+        Returns:
+            URL-safe base64로 인코딩된 cursor 문자열
+    '''
+    raw = json.dumps(values, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, *types):
+    '''
+    cursor 해석 함수
+
+    encode_cursor로 생성된 cursor를 정렬 key 값 목록으로 복원
+
+        Arguments:
+            cursor (str): 클라이언트가 전달한 cursor 문자열
+            types: 각 key 값의 기대 타입
+
+        Raises:
+            HTTP_400_BAD_REQUEST: cursor 형식이 올바르지 않은 경우
+
+        Returns:
+            정렬 key 값 목록
+    '''
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except ValueError:
+        values = None
+    if (not isinstance(values, list) or len(values) != len(types)
+            or not all(isinstance(v, t) for v, t in zip(values, types))):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="잘못된 cursor입니다.")
+    return values
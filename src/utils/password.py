@@ -0,0 +1,121 @@
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+from fastapi import HTTPException, status
+from passlib.context import CryptContext
+
+from src.utils.config import get_settings
+
+_executor: ProcessPoolExecutor | None = None
+_pending = 0
+
+
+@lru_cache
+def _crypt_context(rounds: int):
+    return CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=rounds)
+
+
+def _hash_rounds(hashed: str):
+    '''
+    bcrypt hash에 기록된 cost factor 조회 ($2b$<rounds>$...)
+    '''
+    try:
+        return int(hashed.split("$")[2])
+    except (IndexError, ValueError):
+        return None
+
+
+def _hash(password: str, rounds: int):
+    return _crypt_context(rounds).hash(password)
+
+
+def _verify(password: str, hashed: str, rounds: int):
+    if not _crypt_context(rounds).verify(password, hashed):
+        return False, None
+    if _hash_rounds(hashed) != rounds:
+        return True, _hash(password, rounds)
+    return True, None
+
+
+def init_password_pool():
+    '''
+    비밀번호 hash 전용 process pool 생성 함수
+
+    실행 중인 event loop와 연결, 스레드 상태를 복제하지 않도록 fork 대신 spawn으로 process 생성
+    '''
+    global _executor
+    _executor = ProcessPoolExecutor(max_workers=get_settings().PASSWORD_WORKERS or None,
+                                    mp_context=multiprocessing.get_context("spawn"))
+
+
+def close_password_pool():
+    '''
+    비밀번호 hash 전용 process pool 종료 함수
+    '''
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+    _executor = None
+
+
+async def _run(fn, *args):
+    '''
+    bcrypt 연산을 process pool에서 실행
+
+    대기 중인 연산이 PASSWORD_QUEUE_LIMIT 이상이면 작업을 쌓지 않고 바로 거절
+
+        Raises:
+            HTTP_503_SERVICE_UNAVAILABLE: 대기 중인 연산이 너무 많은 경우
+    '''
+    global _pending
+    if _pending >= get_settings().PASSWORD_QUEUE_LIMIT:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                            detail="요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해주세요.",
+                            headers={"Retry-After": "1"})
+    _pending += 1
+    try:
+        return await asyncio.get_running_loop().run_in_executor(_executor, fn, *args)
+    finally:
+        _pending -= 1
+
+
+async def hash_password(password: str):
+    '''
+    비밀번호 hash 함수
+
+        Arguments:
+            password (str): 평문 비밀번호
+
+        Returns:
+            BCRYPT_ROUNDS cost로 생성한 bcrypt hash
+    '''
+    return await _run(_hash, password, get_settings().BCRYPT_ROUNDS)
+
+
+async def verify_password(password: str, hashed: str):
+    '''
+    비밀번호 확인 함수
+
+    비밀번호가 일치하고 저장된 hash의 cost가 BCRYPT_ROUNDS와 다르면 새로운 hash를 함께 반환
+
+        Arguments:
+            password (str): 평문 비밀번호
+            hashed (str): 저장된 bcrypt hash
+
+        Returns:
+            verified (bool): 비밀번호 일치 여부
+            new_hash (str): 다시 생성한 hash, 변경이 필요 없는 경우 None
+    '''
+    return await _run(_verify, password, hashed, get_settings().BCRYPT_ROUNDS)
+
+
+def get_password_pool_stats():
+    '''
+    비밀번호 hash process pool 상태 조회 함수
+    '''
+    return {
+        "pending": _pending,
+        "queue_limit": get_settings().PASSWORD_QUEUE_LIMIT,
+    }
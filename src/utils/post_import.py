@@ -0,0 +1,115 @@
+import json
+
+from fastapi import HTTPException
+from pydantic import ValidationError
+from redis.asyncio import Redis
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.models import Post
+from src.domain.post import post_schema
+from src.utils.config import get_settings
+from src.utils.counters import incr_post_count
+from src.utils.board_rank import rank_incr
+from src.utils.cache import bump_versions
+from src.utils.excerpt import make_excerpt
+from src.utils.feed import feed_add
+
+
+async def iter_lines(stream):
+    '''
+    요청 body stream을 줄 단위로 나누어 반환하는 함수, body 전체를 메모리에 올리지 않음
+
+        Arguments:
+            stream: bytes chunk를 반환하는 async iterator
+
+        Returns:
+            (줄 번호, 줄 bytes) async iterator, 빈 줄은 제외
+    '''
+    buffer = b""
+    number = 0
+    async for chunk in stream:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            number += 1
+            if line.strip():
+                yield number, line
+    if buffer.strip():
+        yield number + 1, buffer
+
+
+def _parse_line(line: bytes):
+    '''
+    NDJSON 한 줄을 게시글 입력 Schema로 검증
+
+        Raises:
+            ValueError: JSON 형식이 아니거나 Schema 검증에 실패한 경우
+    '''
+    try:
+        return post_schema.Post.model_validate(json.loads(line))
+    except ValidationError as e:
+        error = e.errors()[0]
+        raise ValueError(f"{'.'.join(map(str, error['loc']))}: {error['msg']}" if error["loc"] else error["msg"])
+    except HTTPException as e:
+        raise ValueError(e.detail)
+
+
+async def import_posts(lines, board_id: int, public: bool, user_id: int, db: AsyncSession, rd: Redis):
+    '''
+    게시글 일괄 등록 함수
+
+    NDJSON 줄을 게시글 입력 Schema로 검증하여 IMPORT_BATCH_SIZE개씩 하나의 executemany INSERT로 저장하고,
+    batch마다 게시판의 게시글 수 변경량, 순위, feed, 목록 version을 한 번씩만 갱신
+    검증에 실패한 줄은 건너뛰고 줄 번호와 오류 내용을 기록
+
+        Arguments:
+            lines: iter_lines가 반환하는 (줄 번호, 줄 bytes) async iterator
+            board_id (int): 게시글을 등록할 게시판 ID
+            public (bool): 게시판 공개 여부 (공개 feed 추가 여부)
+            user_id (int): 게시글 작성자 ID
+            db (AsyncSession): DB 세션
+            rd (Redis): Redis 연결
+
+        Returns:
+            imported (int): 등록된 게시글 수
+            failed (int): 등록에 실패한 줄 수
+            errors (list): 실패한 줄의 오류 목록 (최대 IMPORT_MAX_ERRORS개)
+    '''
+    settings = get_settings()
+    imported = 0
+    failed = 0
+    errors = []
+    batch = []
+
+    async def flush():
+        nonlocal imported
+        post_ids = (await db.scalars(insert(Post).returning(Post.id), batch)).all()
+        await db.commit()
+        await incr_post_count(rd, board_id, len(batch))
+        await rank_incr(rd, board_id, len(batch))
+        await feed_add(rd, board_id, public, *post_ids)
+        await bump_versions(rd, ("board_posts", board_id), ("board_list", 0))
+        imported += len(batch)
+        batch.clear()
+
+    async for number, line in lines:
+        try:
+            post = _parse_line(line)
+        except ValueError as e:
+            failed += 1
+            if len(errors) < settings.IMPORT_MAX_ERRORS:
+                errors.append({"line": number, "detail": str(e)})
+            continue
+        batch.append({
+            "board_id": board_id,
+            "user_id": user_id,
+            "title": post.title,
+            "content": post.content,
+            "excerpt": make_excerpt(post.content),
+        })
+        if len(batch) >= settings.IMPORT_BATCH_SIZE:
+            await flush()
+    if batch:
+        await flush()
+    return {"imported": imported, "failed": failed, "errors": errors}
@@ -0,0 +1,67 @@
+from sqlalchemy import select, func, text, literal_column, table, column
+from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import HTTPException, status
+
+from src.core.models import Board, Post, post_search_vector
+
+_post_fts = table("post_fts", column("rowid"))
+
+
+def _fts5_query(q: str):
+    '''
+    검색어를 FTS5 MATCH 구문으로 변환, 각 단어를 따옴표로 감싸 모든 단어를 포함하는 게시글을 검색
+    '''
+    return " ".join('"' + word.replace('"', '""') + '"' for word in q.split())
+
+
+def _ranked_posts(q: str, dialect: str):
+    '''
+    검색어와 일치하는 게시글과 검색 점수(rank, 높을수록 관련도 높음) 조회 쿼리
+
+    PostgreSQL은 GIN 인덱스가 걸린 tsvector, SQLite는 FTS5 table을 사용
+    '''
+    columns = (Post.id, Post.board_id, Post.user_id, Post.title, Post.excerpt)
+    if dialect == "postgresql":
+        tsquery = func.websearch_to_tsquery(text("'simple'::regconfig"), q)
+        return (select(*columns, func.ts_rank_cd(post_search_vector, tsquery).label("rank"))
+                .filter(post_search_vector.op("@@")(tsquery)))
+    if dialect == "sqlite":
+        return (select(*columns, (-func.bm25(literal_column("post_fts"))).label("rank"))
+                .select_from(Post.__table__.join(_post_fts, _post_fts.c.rowid == Post.id))
+                .filter(literal_column("post_fts").match(_fts5_query(q))))
+    raise HTTPException(status_code=status.HTTP_501_NOT_IMPLEMENTED, detail="검색을 지원하지 않는 DB입니다.")
+
+
+async def search_posts(q: str, user_id: int, db: AsyncSession, size: int, after: tuple | None = None):
+    '''
+    게시글 전문 검색 함수
+
+    제목과 내용이 검색어와 일치하는 게시글 중 조회 권한이 있는 (본인이 생성했거나 공개된) 게시판의 게시글을
+    (rank, id) 역순으로 size + 1개 조회
+
+        Arguments:
+            q (str): 검색어
+            user_id (int): 현재 로그인된 유저 ID
+            db (AsyncSession): DB 세션
+            size (int): 조회할 게시글 수
+            after (tuple): 이전 페이지 마지막 게시글의 (rank, id), 첫 페이지는 None
+
+        Raises:
+            HTTP_400_BAD_REQUEST: 검색어가 비어 있는 경우
+
+        Returns:
+            게시글 dict 목록 (rank 포함)
+    '''
+    if not q.strip():
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="검색어를 입력해주세요.")
+    ranked = (_ranked_posts(q, db.get_bind().dialect.name)
+              .join(Board, Board.id == Post.board_id)
+              .filter((Board.user_id == user_id) | (Board.public))
+              .subquery())
+    _query = select(ranked)
+    if after:
+        last_rank, last_id = after
+        _query = _query.filter((ranked.c.rank < last_rank) |
+                               ((ranked.c.rank == last_rank) & (ranked.c.id < last_id)))
+    _query = _query.order_by(ranked.c.rank.desc(), ranked.c.id.desc()).limit(size + 1)
+    return [dict(row) for row in (await db.execute(_query)).mappings()]
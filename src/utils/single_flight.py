@@ -0,0 +1,64 @@
+import asyncio
+
+from src.core.metrics import single_flight_calls, single_flight_shared
+
+
+class SingleFlight:
+    '''
+    동일 요청 병합 (single-flight)
+
+    같은 key로 동시에 호출된 조회는 먼저 시작된 하나의 조회 결과를 함께 사용
+    호출 수와 공유 수는 key의 첫 번째 값(조회 종류)별로 /metrics에도 기록
+
+        Attributes:
+            calls (int): 전체 호출 수
+            shared (int): 다른 호출의 결과를 함께 사용한 호출 수
+    '''
+    def __init__(self):
+        self.calls = 0
+        self.shared = 0
+        self._inflight = {}
+
+    async def do(self, key, fn):
+        '''
+        key에 대해 진행 중인 조회가 있으면 그 결과를 기다리고, 없으면 fn을 실행하여 결과를 공유
+
+        fn은 호출한 요청과 별도의 task에서 실행되므로 먼저 호출한 요청이 취소되어도(클라이언트 연결 종료 등)
+        함께 기다리는 요청은 결과를 받음, 따라서 fn은 요청의 DB 세션 등 요청이 끝나면 정리되는 자원을 사용하지 않아야 함
+
+            Arguments:
+                key: 조회를 구분하는 hashable 값
+                fn: 인자가 없는 async 함수
+
+            Returns:
+                fn의 반환값
+        '''
+        kind = key[0] if isinstance(key, tuple) else key
+        self.calls += 1
+        single_flight_calls.inc(kind)
+        task = self._inflight.get(key)
+        if task is not None:
+            self.shared += 1
+            single_flight_shared.inc(kind)
+        else:
+            task = asyncio.create_task(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._done(key, done))
+        return await asyncio.shield(task)
+
+    def _done(self, key, task):
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # 기다리던 요청이 모두 취소된 경우에도 예외가 처리되지 않은 채로 남지 않도록 조회
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self):
+        return {
+            "calls": self.calls,
+            "shared": self.shared,
+            "coalescing_ratio": self.shared / self.calls if self.calls else 0.0,
+        }
+
+
+single_flight = SingleFlight()
@@ -0,0 +1,112 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+
+from redis.asyncio import Redis
+
+from src.utils.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+TOKEN_INVALIDATE_CHANNEL = "auth:token:invalidate"
+
+
+class TokenCache:
+    '''
+    access token 캐시
+
+    access token에 해당하는 유저 ID를 프로세스 메모리에 저장하는 LRU + TTL 캐시
+
+        Attributes:
+            maxsize (int): 최대 저장 token 수, 초과 시 가장 오래 사용하지 않은 token부터 삭제
+            ttl (float): 캐시 유지 기간 (초), redis 만료 시간보다 길게 유지되지 않음
+            hits (int): 캐시 적중 횟수
+            misses (int): 캐시 미스 횟수
+    '''
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._items = OrderedDict()
+
+    def get(self, token: str):
+        '''
+        token에 해당하는 유저 ID 조회, 없거나 만료된 경우 None
+        '''
+        item = self._items.get(token)
+        if item is None or item[1] <= time.monotonic():
+            if item is not None:
+                del self._items[token]
+            self.misses += 1
+            return None
+        self._items.move_to_end(token)
+        self.hits += 1
+        return item[0]
+
+    def set(self, token: str, user_id: int, ttl: float):
+        '''
+        token 저장, 유지 기간은 캐시 TTL과 redis 잔여 만료 시간 중 짧은 값
+        '''
+        ttl = min(ttl, self.ttl)
+        if ttl <= 0 or self.maxsize <= 0:
+            return
+        self._items[token] = (user_id, time.monotonic() + ttl)
+        self._items.move_to_end(token)
+        while len(self._items) > self.maxsize:
+            self._items.popitem(last=False)
+
+    def invalidate(self, token: str):
+        self._items.pop(token, None)
+
+    def clear(self):
+        self._items.clear()
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "size": len(self._items),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / total if total else 0.0,
+        }
+
+
+token_cache = TokenCache(get_settings().TOKEN_CACHE_SIZE, get_settings().TOKEN_CACHE_TTL_SECONDS)
+
+
+async def invalidate_token(token: str, rd: Redis):
+    '''
+    token 무효화 함수
+
+    현재 프로세스의 캐시에서 token을 삭제하고, 다른 worker에도 삭제하도록 redis pub/sub으로 전파
+    '''
+    token_cache.invalidate(token)
+    await rd.publish(TOKEN_INVALIDATE_CHANNEL, token)
+
+
+async def listen_token_invalidation(rd: Redis):
+    '''
+    token 무효화 구독 함수
+
+    다른 worker에서 전파한 로그아웃 token을 캐시에서 삭제,
+    구독이 끊긴 동안 누락된 메시지가 있을 수 있으므로 재구독 시 캐시를 비움
+    '''
+    while True:
+        pubsub = rd.pubsub()
+        try:
+            await pubsub.subscribe(TOKEN_INVALIDATE_CHANNEL)
+            token_cache.clear()
+            while True:
+                message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                if message:
+                    token_cache.invalidate(message["data"].decode())
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.warning("token 무효화 구독이 끊어졌습니다. 다시 연결합니다.", exc_info=True)
+            await asyncio.sleep(1)
+        finally:
+            await pubsub.reset()